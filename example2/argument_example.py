@@ -1,4 +1,3 @@
-from faker import Faker
 from graphql import GraphQLResolveInfo
 
 from new_graphene.fields.base import Field
@@ -6,7 +5,7 @@ from new_graphene.fields.objecttypes import ObjectType
 from new_graphene.fields.scalars import Integer, String
 from new_graphene.schema import Schema
 
-faker = Faker()
+from .pools import get_pool, next_index
 
 
 class User(ObjectType):
@@ -19,10 +18,11 @@ class Query(ObjectType):
     users = Field(User, search=String())
 
     def resolve_users(root, info: GraphQLResolveInfo, search: str = None):
+        i = next_index()
         return {
-            'firstname': faker.first_name(),
-            'lastname': faker.last_name(),
-            'age': faker.random_int(min=18, max=80),
+            'firstname': get_pool('first_name')[i],
+            'lastname': get_pool('last_name')[i],
+            'age': get_pool('random_int', min=18, max=80)[i],
         }
 
 
@@ -1,12 +1,10 @@
-from faker import Faker
-
 import graphene
 from graphene.types.field import Field
 from graphene.types.interface import Interface
 from graphene.types.objecttype import ObjectType
 from graphene.types.scalars import Int, String
 
-faker = Faker()
+from .pools import get_faker
 
 
 class QuickInterface(Interface):
@@ -32,6 +30,7 @@ class Query(ObjectType):
     #     interfaces = [QuickInterface]
 
     def resolve_users(self, info, search=None):
+        faker = get_faker()
         return User(firstname=faker.first_name(), lastname=faker.last_name(), age=faker.random_int(min=18, max=80))
 
 
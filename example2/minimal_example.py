@@ -1,4 +1,3 @@
-from faker import Faker
 from graphql import GraphQLResolveInfo
 
 from new_graphene.fields.base import Field
@@ -6,7 +5,7 @@ from new_graphene.fields.objecttypes import ObjectType
 from new_graphene.fields.scalars import String
 from new_graphene.schema import Schema
 
-faker = Faker()
+from .pools import get_pool, next_index
 
 
 class User(ObjectType):
@@ -17,7 +16,7 @@ class Query(ObjectType):
     users = Field(User)
 
     def resolve_users(root, info: GraphQLResolveInfo):
-        return {'name': faker.name()}
+        return {'name': get_pool('name')[next_index()]}
 
 
 if __name__ == "__main__":
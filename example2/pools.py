@@ -0,0 +1,30 @@
+"""Values shared by the examples. The examples are run as modules
+from the root of the repository, e.g. `python -m example2.simple`"""
+
+import functools
+import itertools
+
+# Faker is slow compared to the resolvers, so it is imported on first
+# use and the values are generated once and served from pools
+POOL_SIZE = 256
+
+counter = itertools.count()
+
+
+@functools.cache
+def get_faker():
+    from faker import Faker
+    return Faker()
+
+
+@functools.cache
+def get_pool(provider: str, **kwargs) -> tuple:
+    """Returns `POOL_SIZE` values generated by the given Faker provider
+    (e.g. `get_pool('name')` or `get_pool('random_int', min=18, max=80)`)"""
+    method = getattr(get_faker(), provider)
+    return tuple(method(**kwargs) for _ in range(POOL_SIZE))
+
+
+def next_index() -> int:
+    """Returns the index of the next values to serve from the pools"""
+    return next(counter) % POOL_SIZE
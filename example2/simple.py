@@ -1,4 +1,3 @@
-from faker import Faker
 from graphql import GraphQLResolveInfo
 
 from new_graphene.fields.base import Field
@@ -6,7 +5,7 @@ from new_graphene.fields.objecttypes import ObjectType
 from new_graphene.fields.scalars import ID, Integer, String
 from new_graphene.schema import Schema
 
-faker = Faker()
+from .pools import get_pool, next_index
 
 
 class Patron(ObjectType):
@@ -22,11 +21,11 @@ class Query(ObjectType):
         # return Patron(id=1, name="Syrus", age=27)
         # return 'Google'
         # return root.dataclass_model(id=1, name="Syrus", age=27)
-        print(root)
+        i = next_index()
         return {
-            'id': faker.random_int(min=1, max=100),
-            'name': faker.name(),
-            'age': faker.random_int(min=18, max=80)
+            'id': get_pool('random_int', min=1, max=100)[i],
+            'name': get_pool('name')[i],
+            'age': get_pool('random_int', min=18, max=80)[i]
         }
 
 
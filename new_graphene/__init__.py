@@ -1,4 +1,5 @@
 from new_graphene.base import BaseOptions, BaseType
+from new_graphene.compiler import CompiledQuery
 from new_graphene.fields.base import Field
 from new_graphene.fields.helpers import (BaseField, BaseFieldOptions,
                                          ExplicitField, ImplicitField)
@@ -14,6 +15,7 @@ __all__ = [
     'BaseOptions',
     'BigInteger',
     'Boolean',
+    'CompiledQuery',
     'Date',
     'DateTime',
     'Decimal',
@@ -1,4 +1,6 @@
+import functools
 import inspect
+import sys
 from dataclasses import field, make_dataclass
 from typing import Any, List, Mapping, MutableMapping, Optional, Sequence
 
@@ -10,8 +12,25 @@ from new_graphene.typings import (TypeDataclass, TypeExplicitField,
 from new_graphene.utils.base import ObjectTypesEnum
 from new_graphene.utils.printing import PrintingMixin
 
+_ACCEPTED_META_KEYS = frozenset({
+    'name', 'description', 'interfaces', 'abstract', 'default_resolver'
+})
+
+_INTERNAL_FIELD_KEYS = frozenset({'_meta', 'is_object_type'})
+
+# Classes created multiple times (e.g. in tests or when the
+# schema is rebuilt) reuse the docstring that was cleaned
+clean_docstring = functools.lru_cache(maxsize=1024)(inspect.cleandoc)
+
 
 class BaseOptions(PrintingMixin):
+    __slots__ = (
+        'cls', 'name', 'description', 'fields', 'interfaces', 'abstract',
+        'default_resolver', '_base_meta', '_internal_name'
+    )
+
+    accepted_keys: frozenset[str] = _ACCEPTED_META_KEYS
+
     def __init__(self, klass: type['BaseObjectType']):
         self.cls = klass
         # A custom name for the GraphQL type
@@ -20,7 +39,7 @@ class BaseOptions(PrintingMixin):
 
         self.fields: MutableMapping[str, TypeExplicitField] = {}
         self.interfaces: List[TypeInterface] = []
-        self.accepted_keys = {'name', 'description', 'interfaces', 'abstract'}
+        self.abstract: bool = False
 
         self._base_meta: Optional[type] = None
         # Internal name is used to store the name of
@@ -34,67 +53,92 @@ class BaseOptions(PrintingMixin):
     def __repr__(self):
         return self.print_base_options(self)
 
-    def check_meta_options(self, keys: Sequence[str]):
-        """Checks if the provided keys in the Meta class are valid options.
-        Raises an InvalidMetaOptionsError if any invalid keys are found."""
-        _keys = filter(lambda key: not key.startswith('__'), keys)
-        invalid_keys = set(_keys) - self.accepted_keys
+    def check_meta_options(self, keys: Sequence[str]) -> set[str]:
+        """Checks if the provided keys in the Meta class are valid options
+        and returns the user defined keys. Raises an InvalidMetaOptionsError
+        if any invalid keys are found."""
+        user_keys = {key for key in keys if not key.startswith('__')}
+        invalid_keys = user_keys - self.accepted_keys
         if invalid_keys:
             raise InvalidMetaOptionsError(invalid_keys, self.accepted_keys)
+        return user_keys
 
     def set_meta_option(self, key: str, value: Any):
         """Sets the meta options based on the provided key and value."""
         if key in self.accepted_keys:
             setattr(self, key, value)
 
-    def filter_fields(self, namespace: Mapping[str, Any] | Sequence[tuple[str, Any]], sort: bool = False) -> MutableMapping[str, TypeFieldType]:
-        """Filters the fields from the provided namespace"""
-        if isinstance(namespace, (MutableMapping, Mapping)):
-            namespace = list(namespace.items())
-
-        iternal_keys = {'_meta', 'is_object_type'}
-        user_defined_fields = {}
-
-        for key, field_obj in namespace:
-            if key.startswith('_'):
-                continue
-
-            if key in iternal_keys:
-                continue
-
-            if key in user_defined_fields:
-                # This means the field comes from a subclass and
-                # is being overridden by the user, we should keep
-                # the user defined field
-                pass
+    def filter_fields(self, namespace: Mapping[str, Any]) -> MutableMapping[str, TypeFieldType]:
+        """Filters the fields from the provided namespace (e.g. `vars(klass)`)"""
+        return {
+            key: field_obj for key, field_obj in namespace.items()
+            if key[0] != '_' and key not in _INTERNAL_FIELD_KEYS
+        }
 
-            user_defined_fields[key] = field_obj
-        return user_defined_fields
-
-    def build_fields(self, namespace: Mapping[str, Any] | Sequence[tuple[str, Any]]):
+    def build_fields(self, namespace: Mapping[str, Any]):
         """Builds the fields for the ObjectType based on the provided namespace"""
-        from new_graphene.fields.base import Field
-
-        user_defined_fields = self.filter_fields(namespace)
+        return self.mount_fields(self.filter_fields(namespace))
 
+    def mount_fields(self, user_defined_fields: Mapping[str, TypeFieldType]):
+        """Mounts fields which were already filtered with `filter_fields`"""
         for key, field_obj in user_defined_fields.items():
             field = mount_type_as(field_obj, mount_type=Field)
             if field is not None:
-                self.fields[key] = field
-                field_obj.creation_counter += 1
+                # Interned names make the lookups of the resolvers
+                # on the dictionaries returned by the user faster
+                self.fields[sys.intern(key)] = field
         return self.fields
 
     def add_field(self, name: str, field: TypeExplicitField):
         """Adds a field to the ObjectType"""
-        self.fields[name] = field
+        self.fields[sys.intern(name)] = field
 
     def add_interface(self, interface: TypeInterface):
         """Adds an interface to the ObjectType"""
-        fields = self.filter_fields(interface.__dict__)
+        fields = self.filter_fields(vars(interface))
         for key, field_obj in fields.items():
             self.add_field(key, mount_type_as(field_obj, mount_type=Field))
 
 
+class DataclassModel:
+    """Dynamically creates a slotted dataclass for ObjectTypes to hold the field values. 
+    This allows us to have a structured way to store field values and automatically 
+    generate methods like __init__, __eq__, and __repr__ for the ObjectType. Creating 
+    a dataclass is expensive so it is only done the first time the model is accessed 
+    and is then cached on the class itself."""
+
+    cache_name = '_dataclass_model'
+
+    def __get__(self, instance: Optional['BaseType'], owner: type['BaseType']) -> Optional[TypeDataclass]:
+        # The model is looked up in the own namespace of the class
+        # so that subclasses do not inherit the model of their parent
+        dataclass = owner.__dict__.get(self.cache_name)
+        if dataclass is not None:
+            return dataclass
+
+        base_options = owner._meta
+        if owner.internal_type != ObjectTypesEnum.OBJECT_TYPE:
+            return None
+
+        if base_options is None or not base_options.fields:
+            return None
+
+        dataclass_fields = [
+            (key, 'typing.Any', field(default=field_obj.default_value))
+            for key, field_obj in base_options.fields.items()
+        ]
+
+        dataclass = make_dataclass(
+            owner.__name__,
+            dataclass_fields,
+            bases=(),
+            slots=True
+        )
+
+        setattr(owner, self.cache_name, dataclass)
+        return dataclass
+
+
 class BaseObjectType(type):
     def __new__(cls, name: str, bases: tuple[type], namespace: dict, /, **kwds):
         super_new = super().__new__
@@ -104,20 +148,26 @@ class BaseObjectType(type):
 
         klass = super_new(cls, name, bases, namespace)
 
-        if not hasattr(klass, '_meta'):
+        try:
+            klass._meta
+        except AttributeError:
             return klass
 
         base_options = BaseOptions(klass)
-        setattr(klass, '_meta', base_options)
+        klass._meta = base_options
 
-        internal_type = getattr(klass, 'internal_type', None)
+        # The declaring class usually defines its internal type in its
+        # namespace which avoids walking the MRO of the class
+        internal_type = namespace.get('internal_type') or getattr(klass, 'internal_type', None)
         if internal_type is None:
             raise TypeError(
                 f"Class {name} must define an internal_type attribute"
             )
 
-        if base_options.description is None and klass.__doc__ is not None:
-            base_options.description = inspect.cleandoc(klass.__doc__)
+        # The docstring of a class is never inherited
+        docstring = namespace.get('__doc__')
+        if docstring is not None:
+            base_options.description = clean_docstring(docstring)
 
         # Extract the Meta class from the namespace
         # and process its options
@@ -125,56 +175,37 @@ class BaseObjectType(type):
         if user_meta is not None:
             base_options._base_meta = user_meta
 
-            keys = user_meta.__dict__.keys()
-            base_options.check_meta_options(keys)
-            for key, value in user_meta.__dict__.items():
-                base_options.set_meta_option(key, value)
+            meta_options = user_meta.__dict__
+            for key in base_options.check_meta_options(meta_options):
+                setattr(base_options, key, meta_options[key])
 
-        if internal_type == ObjectTypesEnum.INTERFACE:
+        # The name of the type is final once the Meta options are
+        # applied so the representation of the instances is built once
+        klass._representation = base_options.print_base_type(klass)
+
+        if internal_type is ObjectTypesEnum.INTERFACE:
             base_options.build_fields(namespace)
-            klass.prepare(klass)
             return klass
 
-        # Dynamically create a dataclass for ObjectTypes to hold the field values,
-        # only if the class is marked as an ObjectType. This allows us to have a
-        # structured way to store field values and automatically generate methods
-        # like __init__, __eq__, and __repr__ for the ObjectType. The dataclass will b
-        # e created with the name of the class and will inherit from any bases if necessary.
-        # The fields for the dataclass will be determined based on the fields defined in the
-        # BaseOptions, but only
-        from new_graphene.fields.base import Field
-
-        if internal_type == ObjectTypesEnum.OBJECT_TYPE:
-            if bases[-1] == BaseType:
+        # The dataclass holding the field values of the ObjectType is not
+        # created here but by DataclassModel, the first time it is needed
+        if internal_type is ObjectTypesEnum.OBJECT_TYPE:
+            if bases[-1] is BaseType:
                 return klass
 
-            filtered_fields = base_options.filter_fields(namespace)
-
-            # Add the fields of the interface on the ObjectType
+            # Add the fields of the interfaces after the ones of the
+            # ObjectType which keep their declaration order and take
+            # precedence over the ones defined on the interfaces
             interfaces = getattr(user_meta, 'interfaces', [])
+            filtered_fields = base_options.filter_fields(namespace)
             for interface in interfaces:
-                filtered_fields.update(interface._meta.fields)
+                for key, field_obj in interface._meta.fields.items():
+                    filtered_fields.setdefault(key, field_obj)
 
             if not filtered_fields:
                 return klass
 
-            base_options.build_fields(filtered_fields)
-
-            _dataclass_fields = []
-
-            for key, obj_field in filtered_fields.items():
-                default_value = None
-
-                if isinstance(obj_field, Field):
-                    default_value = obj_field.default_value
-
-                _dataclass_fields.append(
-                    (
-                        key,
-                        'typing.Any',
-                        field(default=default_value)
-                    )
-                )
+            base_options.mount_fields(filtered_fields)
 
             # If the class is a subclass of another ObjectType,
             # we need to make sure to include the fields from the
@@ -196,27 +227,8 @@ class BaseObjectType(type):
             #     for key, value in user_defined_fields.items():
             #         base_options.add_field(key, mount_type_as(value, Field))
 
-            dataclass = make_dataclass(name, _dataclass_fields, bases=())
-            setattr(klass, 'dataclass_model', dataclass)
-
-            klass.prepare(klass)
-
         return klass
 
-    @classmethod
-    def prepare(cls, klass: type['BaseTypeMetaclass']):
-        """Finalizes the preparation of the ObjectType by setting 
-        the name and description if they are not already set."""
-        pass
-
-    @classmethod
-    def prepare_objecttype(cls, klass: type['BaseObjectType'], base_options: BaseOptions):
-        pass
-
-    @classmethod
-    def prepare_interface(cls, klass: type['BaseObjectType'], base_options: BaseOptions):
-        pass
-
 
 class BaseTypeMetaclass(metaclass=BaseObjectType):
     _meta: Optional['BaseOptions'] = None
@@ -234,17 +246,15 @@ class BaseType(BaseTypeMetaclass):
         * description (str): Description of the GraphQL type in the schema. Defaults to class docstring.
         * interfaces (Sequence[Interface]): A list of interfaces that the ObjectType implements. Only applicable to ObjectTypes.
         * abstract (bool): If True, the type is marked as abstract and cannot be instantiated directly. This is useful for creating base types that are meant to beinherited by other types. Defaults to False.
+        * default_resolver (Callable): Default resolver for the fields of the ObjectType. Use `dict_resolver` when the resolvers always return dictionaries.
     """
 
-    dataclass_model: Optional[TypeDataclass] = None
+    _representation: str
+    dataclass_model: Optional[TypeDataclass] = DataclassModel()
     internal_type: Optional[ObjectTypesEnum] = ObjectTypesEnum.NOT_DEFINED
 
     def __str__(self):
-        return self._meta.print_base_type(self)
+        return self._representation
 
     def __repr__(self):
-        return self._meta.print_base_type(self)
-
-    @classmethod
-    def create(cls, name: str, **kwargs):
-        pass
+        return self._representation
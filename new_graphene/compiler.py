@@ -0,0 +1,371 @@
+import inspect
+import itertools
+from typing import Any, Callable, Optional, Sequence
+
+from graphql import (BREAK, DocumentNode, ExecutionContext, ExecutionResult,
+                     FragmentDefinitionNode, GraphQLError, GraphQLField,
+                     GraphQLObjectType, GraphQLOutputType, GraphQLResolveInfo,
+                     GraphQLSchema, OperationType, Undefined, Visitor,
+                     default_field_resolver, execute_sync, get_operation_ast,
+                     is_leaf_type, is_list_type, is_non_null_type,
+                     is_object_type, located_error, visit)
+from graphql.execution.collect_fields import (collect_fields,
+                                              collect_sub_fields)
+from graphql.execution.values import get_argument_values, get_variable_values
+from graphql.language import FieldNode
+from graphql.pyutils import Path
+from graphql.pyutils import inspect as inspect_value
+from graphql.pyutils import is_awaitable, is_iterable
+
+
+class NotCompilableError(Exception):
+    """Raised when the operation uses a feature that the
+    compiler does not support (e.g. directives, abstract types)"""
+
+
+class CompilationFallback(Exception):
+    """Raised by a compiled query before any resolver is called when the
+    variables can not be coerced. The query is then executed by graphql-core
+    which reports the errors"""
+
+
+def handle_field_error(error: GraphQLError, is_non_null: bool, errors: list[GraphQLError]) -> None:
+    """Mirrors `ExecutionContext.handle_field_error`: errors of non-null
+    fields propagate to the parent field and the others are recorded"""
+    if is_non_null:
+        raise error
+    errors.append(error)
+    return None
+
+
+def leaf_value_error(return_type: GraphQLOutputType, value: Any, serialized_value: Any) -> TypeError:
+    return TypeError(
+        f"Expected `{inspect_value(return_type)}.serialize({inspect_value(value)})`"
+        f" to return non-nullable value, returned: {inspect_value(serialized_value)}"
+    )
+
+
+class DirectivesVisitor(Visitor):
+    def __init__(self):
+        super().__init__()
+        self.has_directives = False
+
+    def enter_directive(self, *args):
+        self.has_directives = True
+        return BREAK
+
+
+class VariablesVisitor(Visitor):
+    def __init__(self):
+        super().__init__()
+        self.has_variables = False
+
+    def enter_variable(self, *args):
+        self.has_variables = True
+        return BREAK
+
+
+class QueryCompiler:
+    """Generates the source of a Python function which executes a query
+    operation as straight-line code: the selection set is unrolled at
+    compile time into direct calls to the field resolvers and serializers.
+
+    The errors raised by the resolvers are handled like graphql-core does: the
+    nearest nullable field is set to null and the error is recorded at the path
+    of the field. Abstract types, introspection fields, directives, asynchronous
+    resolvers and mutations raise `NotCompilableError`.
+
+    Args:
+        schema (GraphQLSchema): The schema the document was validated against.
+        document (DocumentNode): The parsed and validated document.
+        operation_name (str, optional): The name of the operation to compile.
+    """
+
+    def __init__(self, schema: GraphQLSchema, document: DocumentNode, operation_name: Optional[str] = None):
+        self.schema = schema
+        self.document = document
+        self.operation = get_operation_ast(document, operation_name)
+
+        if self.operation is None or self.operation.operation != OperationType.QUERY:
+            raise NotCompilableError('Only query operations can be compiled')
+
+        if self.schema.query_type is None:
+            raise NotCompilableError('The schema does not define a query type')
+
+        visitor = DirectivesVisitor()
+        visit(document, visitor)
+        if visitor.has_directives:
+            raise NotCompilableError('Directives are not supported')
+
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+        self.lines: list[str] = []
+        self.counter = itertools.count()
+        self.namespace: dict[str, Any] = {
+            'CompilationFallback': CompilationFallback,
+            'GraphQLError': GraphQLError,
+            'handle_field_error': handle_field_error,
+            'leaf_value_error': leaf_value_error,
+            'located_error': located_error,
+            'ResolveInfo': GraphQLResolveInfo,
+            'Path': Path,
+            'Undefined': Undefined,
+            'is_awaitable': is_awaitable,
+            'is_iterable': is_iterable,
+            'get_argument_values': get_argument_values,
+            'get_variable_values': get_variable_values,
+            'schema': schema,
+            'operation': self.operation,
+            'fragments': self.fragments,
+            'variable_definitions': self.operation.variable_definitions
+        }
+
+    def _name(self, prefix: str) -> str:
+        return f'{prefix}_{next(self.counter)}'
+
+    def _constant(self, prefix: str, value: Any) -> str:
+        name = self._name(prefix)
+        self.namespace[name] = value
+        return name
+
+    @staticmethod
+    def _has_variables(field_node: FieldNode) -> bool:
+        visitor = VariablesVisitor()
+        for argument in field_node.arguments:
+            visit(argument, visitor)
+        return visitor.has_variables
+
+    def _emit(self, depth: int, line: str):
+        self.lines.append('    ' * depth + line)
+
+    def compile(self) -> tuple[str, Callable[[Any, Any, dict[str, Any]], tuple[Optional[dict[str, Any]], list[GraphQLError]]]]:
+        """Returns the generated source and the compiled function. The function
+        returns the data and the errors raised while executing the query"""
+        self._emit(0, 'def compiled_query(root_value, context_value, raw_variables):')
+
+        if self.operation.variable_definitions:
+            self._emit(1, 'variable_values = get_variable_values(schema, variable_definitions, raw_variables)')
+            self._emit(1, 'if isinstance(variable_values, list):')
+            self._emit(2, 'raise CompilationFallback')
+        else:
+            self._emit(1, 'variable_values = {}')
+
+        root_type = self.schema.query_type
+        fields = collect_fields(
+            self.schema,
+            self.fragments,
+            {},
+            root_type,
+            self.operation.selection_set
+        )
+
+        self._emit(1, 'errors = []')
+        self._emit(1, 'data = {}')
+        self._emit(1, 'try:')
+        self._compile_fields(root_type, fields, 'root_value', 'data', 'None', 2)
+        # Errors propagated by the non-null root fields null the whole data
+        self._emit(1, 'except GraphQLError as error:')
+        self._emit(2, 'errors.append(error)')
+        self._emit(2, 'return None, errors')
+        self._emit(1, 'return data, errors')
+
+        source = '\n'.join(self.lines)
+        code = compile(source, '<compiled query>', 'exec')
+        exec(code, self.namespace)
+        return source, self.namespace['compiled_query']
+
+    def _compile_fields(self, parent_type: GraphQLObjectType, fields: dict[str, list[FieldNode]], source: str, target: str, path: str, depth: int):
+        for response_key, field_nodes in fields.items():
+            field_name = field_nodes[0].name.value
+
+            if field_name == '__typename':
+                self._emit(depth, f'{target}[{response_key!r}] = {parent_type.name!r}')
+                continue
+
+            if field_name.startswith('__'):
+                raise NotCompilableError('Introspection fields are not supported')
+
+            field_def: Optional[GraphQLField] = parent_type.fields.get(field_name)
+            if field_def is None:
+                continue
+
+            resolve = field_def.resolve or default_field_resolver
+            if inspect.iscoroutinefunction(resolve) or inspect.isasyncgenfunction(resolve):
+                raise NotCompilableError('Asynchronous resolvers are not supported')
+
+            resolver = self._constant('resolver', resolve)
+            nodes = self._constant('field_nodes', field_nodes)
+            return_type = self._constant('return_type', field_def.type)
+            parent = self._constant('parent_type', parent_type)
+
+            field_path = self._name('path')
+            info = self._name('info')
+            value = self._name('value')
+            result = self._name('result')
+            label = f'{parent_type.name}.{field_name}'
+
+            self._emit(depth, f'{field_path} = Path({path}, {response_key!r}, {parent_type.name!r})')
+            self._emit(
+                depth,
+                f'{info} = ResolveInfo({field_name!r}, {nodes}, {return_type}, {parent}, {field_path}, '
+                'schema, fragments, root_value, operation, variable_values, context_value, is_awaitable)'
+            )
+            self._emit(depth, 'try:')
+
+            if not field_def.args:
+                self._emit(depth + 1, f'{value} = {resolver}({source}, {info})')
+            elif self._has_variables(field_nodes[0]):
+                # Arguments referencing variables can
+                # only be coerced when the query is called
+                field = self._constant('field', field_def)
+                arguments = self._name('arguments')
+                self._emit(depth + 1, f'{arguments} = get_argument_values({field}, {nodes}[0], variable_values)')
+                self._emit(depth + 1, f'{value} = {resolver}({source}, {info}, **{arguments})')
+            else:
+                # Literal arguments and the default values of the
+                # arguments which are omitted are constant and are
+                # coerced once at compile time
+                arguments = self._constant(
+                    'arguments',
+                    get_argument_values(field_def, field_nodes[0], {})
+                )
+                self._emit(depth + 1, f'{value} = {resolver}({source}, {info}, **{arguments})')
+
+            self._compile_value(field_def.type, field_nodes, nodes, label, value, result, field_path, depth + 1)
+            self._compile_field_error(field_def.type, nodes, result, field_path, depth)
+            self._emit(depth, f'{target}[{response_key!r}] = {result}')
+
+    def _compile_field_error(self, return_type: GraphQLOutputType, nodes: str, result: str, path: str, depth: int):
+        self._emit(depth, 'except Exception as raw_error:')
+        self._emit(
+            depth + 1,
+            f'{result} = handle_field_error(located_error(raw_error, {nodes}, {path}.as_list()), '
+            f'{is_non_null_type(return_type)}, errors)'
+        )
+
+    def _compile_value(self, return_type: GraphQLOutputType, field_nodes: list[FieldNode], nodes: str, label: str, value: str, result: str, path: str, depth: int):
+        self._emit(depth, f'if isinstance({value}, Exception):')
+        self._emit(depth + 1, f'raise {value}')
+
+        if is_non_null_type(return_type):
+            self._compile_nullable_value(return_type.of_type, field_nodes, nodes, label, value, result, path, depth)
+            message = self._constant('message', f'Cannot return null for non-nullable field {label}.')
+            self._emit(depth, f'if {result} is None:')
+            self._emit(depth + 1, f'raise TypeError({message})')
+            return
+
+        self._compile_nullable_value(return_type, field_nodes, nodes, label, value, result, path, depth)
+
+    def _compile_nullable_value(self, return_type: GraphQLOutputType, field_nodes: list[FieldNode], nodes: str, label: str, value: str, result: str, path: str, depth: int):
+        self._emit(depth, f'if {value} is None or {value} is Undefined:')
+        self._emit(depth + 1, f'{result} = None')
+        self._emit(depth, 'else:')
+        depth += 1
+
+        if is_leaf_type(return_type):
+            serialize = self._constant('serialize', return_type.serialize)
+            leaf_type = self._constant('leaf_type', return_type)
+            self._emit(depth, f'{result} = {serialize}({value})')
+            self._emit(depth, f'if {result} is None or {result} is Undefined:')
+            self._emit(depth + 1, f'raise leaf_value_error({leaf_type}, {value}, {result})')
+        elif is_list_type(return_type):
+            index = self._name('index')
+            item = self._name('item')
+            item_path = self._name('path')
+            item_result = self._name('result')
+            message = self._constant(
+                'message',
+                f"Expected Iterable, but did not find one for field '{label}'."
+            )
+
+            self._emit(depth, f'if not is_iterable({value}):')
+            self._emit(depth + 1, f'raise GraphQLError({message})')
+            self._emit(depth, f'{result} = []')
+            self._emit(depth, f'for {index}, {item} in enumerate({value}):')
+            self._emit(depth + 1, f'{item_path} = Path({path}, {index}, None)')
+            self._emit(depth + 1, 'try:')
+            self._compile_value(return_type.of_type, field_nodes, nodes, label, item, item_result, item_path, depth + 2)
+            self._compile_field_error(return_type.of_type, nodes, item_result, item_path, depth + 1)
+            self._emit(depth + 1, f'{result}.append({item_result})')
+        elif is_object_type(return_type):
+            if return_type.is_type_of is not None:
+                raise NotCompilableError('is_type_of is not supported')
+
+            fields = collect_sub_fields(
+                self.schema,
+                self.fragments,
+                {},
+                return_type,
+                field_nodes
+            )
+            self._emit(depth, f'{result} = {{}}')
+            self._compile_fields(return_type, fields, value, result, path, depth)
+        else:
+            raise NotCompilableError('Abstract types are not supported')
+
+
+class CompiledQuery:
+    """A query compiled into a specialized Python function. Calling the
+    compiled query executes the generated function and falls back to the
+    regular graphql-core execution when the operation could not be compiled
+    or when the variables can not be coerced. The fallback happens before any
+    resolver is called so that the resolvers are never executed twice.
+
+    .. code-block:: python
+        compiled_query = schema.compile('{ users { name } }')
+        for _ in range(1000):
+            result = compiled_query()
+
+    Args:
+        schema (GraphQLSchema): The schema used to execute the query.
+        document (DocumentNode, optional): The parsed and validated document.
+        errors (Sequence[GraphQLError]): The errors returned by the validation of the document.
+        operation_name (str, optional): The name of the operation to execute.
+    """
+
+    def __init__(self, schema: GraphQLSchema, document: Optional[DocumentNode], errors: Sequence[GraphQLError], operation_name: Optional[str] = None):
+        self.schema = schema
+        self.document = document
+        self.errors = errors
+        self.operation_name = operation_name
+        self.source: Optional[str] = None
+        self._function: Optional[Callable[..., tuple[Optional[dict[str, Any]], list[GraphQLError]]]] = None
+
+        if document is not None and not errors:
+            try:
+                compiler = QueryCompiler(schema, document, operation_name)
+                self.source, self._function = compiler.compile()
+            except NotCompilableError:
+                pass
+
+    def __repr__(self):
+        return f"<CompiledQuery :: {'compiled' if self.is_compiled else 'fallback'}>"
+
+    @property
+    def is_compiled(self) -> bool:
+        return self._function is not None
+
+    def __call__(self, root: Any = None, context: Any = None, variables: Optional[dict[str, Any]] = None) -> ExecutionResult:
+        if self.errors:
+            return ExecutionResult(data=None, errors=list(self.errors))
+
+        if self._function is not None:
+            try:
+                data, errors = self._function(root, context, variables or {})
+            except CompilationFallback:
+                pass
+            else:
+                return ExecutionContext.build_response(data, errors)
+
+        return execute_sync(
+            self.schema,
+            self.document,
+            root_value=root,
+            context_value=context,
+            variable_values=variables,
+            operation_name=self.operation_name
+        )
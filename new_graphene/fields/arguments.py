@@ -1,12 +1,25 @@
+import copy
+import functools
 import itertools
-from collections import OrderedDict
-from typing import Any, MutableMapping, Optional
+from types import MappingProxyType
+from typing import Any, Mapping, MutableMapping, Optional
 
 from new_graphene.fields.dynamic import Dynamic
-from new_graphene.fields.helpers import ExplicitField, ImplicitField
+from new_graphene.fields.helpers import (EMPTY_MAPPING, ExplicitField,
+                                         ImplicitField)
+from new_graphene.fields.input import InputField
 from new_graphene.typings import TypeAllTypes, TypeField, TypeScalar
 
 
+@functools.cache
+def get_mounted_field_types() -> tuple[type, ...]:
+    """Returns the field classes which cannot be used as arguments. 
+    Field imports this module so it is only imported the first time
+    the arguments are translated."""
+    from new_graphene.fields.base import Field
+    return (Field, InputField)
+
+
 class Argument[F = type[TypeScalar]](ExplicitField):
     """An argument is a special type of field that is used to define the arguments of a field in a 
     GraphQL schema. Arguments are defined using the `Argument` class, and can be used to specify the type, 
@@ -47,6 +60,8 @@ class Argument[F = type[TypeScalar]](ExplicitField):
         required (bool, optional): Indicates this argument as not null in the graphql schema. Same behavior as graphene.NonNull. Default False.
     """
 
+    __slots__ = ('default_value', 'deprecation_reason', 'name', 'required')
+
     def __init__(self, field_type: F, default_value: Optional[TypeAllTypes] = None, deprecation_reason: Optional[str] = None, name: Optional[str] = None, required: bool = False):
         super().__init__(field_type)
 
@@ -60,62 +75,71 @@ class Argument[F = type[TypeScalar]](ExplicitField):
         return self.print_argument(self)
 
     def __eq__(self, other: Any) -> bool:
-        return all([
-            isinstance(other, Argument),
-            self.name == other.name,
-            self.field_type == other.field_type,
-            self.default_value == other.default_value,
-            self.deprecation_reason == other.deprecation_reason,
-            self.required == other.required
-        ])
+        return (
+            isinstance(other, Argument)
+            and self.name == other.name
+            and self.required == other.required
+            and (self.field_type is other.field_type or self.field_type == other.field_type)
+            and self.default_value == other.default_value
+            and self.deprecation_reason == other.deprecation_reason
+        )
 
     @classmethod
-    def translate_arguments(cls, field_obj: TypeField) -> MutableMapping[str, 'Argument']:
+    def translate_arguments(cls, field_obj: TypeField | Mapping[str, Any], extra_args: Optional[Mapping[str, Any]] = None) -> Mapping[str, 'Argument']:
         """Translate a set of arguments provided to a field into instances of the `Argument` class.
-        Invalid arguments will raise `ValueError`."""
-        from new_graphene.fields.base import Field
-        from new_graphene.fields.input import InputField
-
-        all_args = list(
-            itertools.chain(
-                field_obj.args.items(),
-                field_obj.extra_args.items()
-            )
-        )
+        Invalid arguments will raise `ValueError`.
 
-        final_arguments = OrderedDict()
+        The arguments are read from `args` and `extra_args` on the field. A mapping of
+        arguments can also be passed directly with the extra arguments."""
+        if isinstance(field_obj, Mapping):
+            args = field_obj
+        else:
+            args = field_obj.args
+            extra_args = field_obj.extra_args
 
-        for key, value in all_args:
-            if isinstance(value, Dynamic):
-                field_type = value._get_type()
-                if field_type is None:
-                    continue
+        if not args and not extra_args:
+            return EMPTY_MAPPING
 
-            instance: Optional[Argument] = None
+        final_arguments = cls._translate_arguments(args, extra_args or EMPTY_MAPPING)
+        return MappingProxyType(final_arguments) if final_arguments else EMPTY_MAPPING
+
+    @classmethod
+    def _translate_arguments(cls, args: Mapping[str, Any], extra_args: Mapping[str, Any]) -> MutableMapping[str, 'Argument']:
+        mounted_types = get_mounted_field_types()
 
-            if isinstance(value, (Field, InputField)):
+        if extra_args:
+            all_args = itertools.chain(args.items(), extra_args.items())
+        else:
+            all_args = args.items()
+
+        final_arguments = {}
+
+        for key, value in all_args:
+            # Arguments are the most common values so they are
+            # checked first and each value is only checked once
+            if isinstance(value, cls):
+                # The argument is copied since its name is set below
+                # and the same instance can be used by other fields
+                instance = copy.copy(value)
+            elif isinstance(value, mounted_types):
                 raise ValueError(
                     f"Expected {key} to be Argument, but received {type(value).__name__}. Try using Argument({value.field_type})."
                 )
-
-            if isinstance(value, ImplicitField):
+            elif isinstance(value, ImplicitField):
+                if isinstance(value, Dynamic) and value._get_type() is None:
+                    continue
                 instance = cls.create_new_field(value)
+            else:
+                continue
 
-            if instance is None and isinstance(value, cls):
-                instance = value
-
-            if instance is not None:
-                if not isinstance(instance, Argument):
-                    raise ValueError(f'Unknown argument "{key}".')
+            default_name = instance.name or key
+            if instance.name is None:
+                instance.name = default_name
 
-                default_name = instance.name or key
-                if instance.name is None:
-                    instance.name = default_name
-
-                if default_name in final_arguments:
-                    raise ValueError(
-                        f'More than one Argument have same name "{default_name}".')
+            if default_name in final_arguments:
+                raise ValueError(
+                    f'More than one Argument have same name "{default_name}".')
 
-                final_arguments[default_name] = instance
+            final_arguments[default_name] = instance
 
         return final_arguments
@@ -1,9 +1,9 @@
-import functools
 from typing import Callable, MutableMapping, Optional
 
 from new_graphene.fields.arguments import Argument
-from new_graphene.fields.helpers import ExplicitField, inspect_type
-from new_graphene.fields.resolvers import source_resolver
+from new_graphene.fields.helpers import EMPTY_MAPPING, ExplicitField
+from new_graphene.fields.resolvers import (shared_source_resolver,
+                                           source_resolver)
 from new_graphene.fields.structures import NonNull
 from new_graphene.typings import (TypeArgument, TypeDynamic, TypeMapping,
                                   TypeObjectType, TypeResolver, TypeScalar,
@@ -37,6 +37,11 @@ class Field[F = type[TypeScalar | TypeObjectType]](ExplicitField):
         **extra_args (TypeScalar, optional): Any additional arguments to mount on the field. This can be used to specify additional configuration options for the field, such as custom directives or extensions. These extra arguments will be passed through to the underlying GraphQL library when the schema is generated, allowing for advanced users to take advantage of features that may not be directly supported by the Field class itself.
     """
 
+    __slots__ = (
+        'extra_args', 'resolver', 'deprecation_reason', 'name',
+        'description', 'required', 'default_value'
+    )
+
     def __init__(self, field_type: F, *, args: Optional[TypeMapping[TypeArgument | TypeDynamic]] = None, resolver: Optional[TypeResolver] = None, source: Optional[str] = None, deprecation_reason: Optional[str] = None, name: Optional[str] = None, description: Optional[str] = None, required: bool = False, default_value: Optional[TypeScalar] = None, **extra_args: TypeScalar):
         super().__init__(field_type)
 
@@ -45,7 +50,9 @@ class Field[F = type[TypeScalar | TypeObjectType]](ExplicitField):
                 f"Expected field_type to be a type, got {type(field_type).__name__}"
             )
 
-        if args is not None and not isinstance(args, MutableMapping):
+        # Checking against the MutableMapping ABC is slow so the
+        # common case of a plain dict is checked beforehand
+        if args is not None and type(args) is not dict and not isinstance(args, MutableMapping):
             raise TypeError(
                 f"Expected args to be a MutableMapping, got {type(args).__name__}"
             )
@@ -63,12 +70,9 @@ class Field[F = type[TypeScalar | TypeObjectType]](ExplicitField):
         if required:
             field_type = NonNull(field_type)
 
-        if isinstance(name, (Argument, ExplicitField)):
-            pass
-
         self.field_type: F | TypeStructure = field_type
-        self.args = args or {}  # TODO: Remove
-        self.extra_args = extra_args  # TODO: Remove
+        self.args = args or EMPTY_MAPPING  # TODO: Remove
+        self.extra_args = extra_args or EMPTY_MAPPING  # TODO: Remove
         self._arguments = Argument.translate_arguments(self)
         self.resolver = resolver
         self.deprecation_reason = deprecation_reason
@@ -78,18 +82,21 @@ class Field[F = type[TypeScalar | TypeObjectType]](ExplicitField):
         self.default_value = default_value
 
         if source is not None:
-            self.resolver = functools.partial(source_resolver, source)
+            if default_value is None:
+                self.resolver = shared_source_resolver(source)
+            else:
+                self.resolver = source_resolver(source, default_value)
 
     def __repr__(self) -> str:
         return self.print_field(self)
 
     def _get_type(self):
-        return inspect_type(self.field_type)
+        # The field type is validated as a class in __init__ and is
+        # never a lazy reference so it can be returned directly
+        return self.field_type
 
     def wrap_resolve(self, parent_resolver):
         return self.resolver or parent_resolver
 
     def wrap_subscribe(self, parent: Callable | None):
         return parent
-        return parent
-        return parent
@@ -1,10 +1,8 @@
-import functools
-import inspect
 from typing import Callable
 
 from graphql import GraphQLSchema
 
-from new_graphene.fields.helpers import ImplicitField
+from new_graphene.fields.helpers import LAZY_TYPE_CALLABLES, ImplicitField
 from new_graphene.typings import TypeScalar
 
 
@@ -24,16 +22,27 @@ class Dynamic[T = TypeScalar](ImplicitField):
         with_schema (bool): Whether to pass the schema to the lazy_type callable when resolving the type. Default is False.
     """
 
+    __slots__ = ('field_type', 'with_schema', '_cached_type')
+
     def __init__(self, lazy_type: Callable[..., T] | Callable[[GraphQLSchema], T], with_schema: bool = False):
         super().__init__()
 
-        if not inspect.isfunction(lazy_type) and not isinstance(lazy_type, functools.partial):
+        if type(lazy_type) not in LAZY_TYPE_CALLABLES:
             raise TypeError("Dynamic field type must be a function.")
 
         self.field_type = lazy_type
         self.with_schema = with_schema
+        self._cached_type = None
 
     def _get_type(self, schema: GraphQLSchema = None) -> T:
-        if schema is not None and self.with_schema:
-            return self.field_type(schema=schema)
-        return self.field_type()
+        if self.with_schema:
+            if schema is not None:
+                return self.field_type(schema=schema)
+            return self.field_type()
+
+        # The type does not depend on the schema so it is
+        # resolved once. A lazy type returning None is not
+        # defined yet and is called again on the next access
+        if self._cached_type is None:
+            self._cached_type = self.field_type()
+        return self._cached_type
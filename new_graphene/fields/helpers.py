@@ -1,16 +1,20 @@
 import functools
-import inspect
-from functools import total_ordering
-from typing import Any, Callable, Optional, Type
+import itertools
+from types import FunctionType, MappingProxyType
+from typing import Any, Callable, Mapping, Optional, Type
 from warnings import deprecated
 
 from new_graphene.typings import (TypeArgument, TypeFieldType, TypeObjectType,
                                   TypeScalar)
 from new_graphene.utils.base import ObjectTypesEnum
-from new_graphene.utils.module_loading import import_string
+from new_graphene.utils.module_loading import cached_import_string
 from new_graphene.utils.printing import PrintingMixin
 
 
+# The callables which are called to resolve a lazy type
+LAZY_TYPE_CALLABLES = frozenset({FunctionType, functools.partial})
+
+
 # get_type
 @deprecated('We will be importing the items directly in _get_type instead of using this helper function.')
 def inspect_type(item: TypeFieldType | TypeScalar | Callable[..., Any] | Any):
@@ -18,9 +22,9 @@ def inspect_type(item: TypeFieldType | TypeScalar | Callable[..., Any] | Any):
     used to resolve the type of an item that can be defined by
     a Python path string, a callable, or a direct instance."""
     if isinstance(item, str):
-        return import_string(item)
+        return cached_import_string(item)
 
-    if inspect.isfunction(item) or isinstance(item, functools.partial):
+    if type(item) in LAZY_TYPE_CALLABLES:
         return item()
 
     return item
@@ -30,19 +34,25 @@ MAX_INT = 2147483647
 
 MIN_INT = -2147483648
 
+# Global counter which keeps the fields in
+# the order in which they were declared
+next_creation_counter = itertools.count(1).__next__
+
+# Read-only mapping shared by the fields which do
+# not have any arguments instead of an empty dict
+EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+
 
 class BaseFieldOptions:
+    __slots__ = ('cls', 'name', 'description', '_internal_name', '_class_name')
+
     def __init__(self, name: str, cls: TypeFieldType):
         self.cls = cls
-        self.name: str = None
+        self.name: str = name
         self.description: Optional[str] = None
-        self._internal_name: str = None
+        self._internal_name: str = name
         self._class_name: str = name
 
-        if self.name is None:
-            self.name = self._class_name
-            self._internal_name = self._class_name
-
     def __repr__(self):
         return f"<{self.name or self._class_name}Options [{self.cls}]>"
 
@@ -55,7 +65,6 @@ class BaseFieldType(type):
         return super_new(cls, name, bases, attrs)
 
 
-@total_ordering
 class BaseField(PrintingMixin):
     """BaseField is the base class for all field types in the Graphene library. It is a container
     that saves information about the field, such as its type, resolver, and other configuration options.
@@ -71,15 +80,17 @@ class BaseField(PrintingMixin):
         counter (int, optional): The creation counter for the field. If not provided, it will be automatically assigned. This counter is used to maintain the order of field definitions, ensuring that fields are processed in the order they were defined in the class.
     """
 
-    creation_counter: int = 1
+    __slots__ = ('args', 'kwargs', '_arguments', 'creation_counter')
+
     is_mounted: bool = False
     internal_type: Optional[ObjectTypesEnum] = ObjectTypesEnum.FIELD
     _meta: Optional[BaseFieldOptions]
 
-    def __init__(self, *args: TypeArgument, **kwargs: TypeArgument):
+    def __init__(self, *args: TypeArgument, counter: Optional[int] = None, **kwargs: TypeArgument):
         self.args = args
-        self.kwargs = kwargs
-        self._arguments: dict[str, TypeArgument] = {}
+        self.kwargs = kwargs or EMPTY_MAPPING
+        self._arguments: Mapping[str, TypeArgument] = EMPTY_MAPPING
+        self.creation_counter: int = next_creation_counter() if counter is None else counter
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(other, BaseField):
@@ -91,13 +102,23 @@ class BaseField(PrintingMixin):
             return self.creation_counter < other.creation_counter
         return NotImplemented
 
+    def __le__(self, other: Any) -> bool:
+        if isinstance(other, BaseField):
+            return self.creation_counter <= other.creation_counter
+        return NotImplemented
+
     def __gt__(self, other: Any) -> bool:
         if isinstance(other, BaseField):
             return self.creation_counter > other.creation_counter
         return NotImplemented
 
+    def __ge__(self, other: Any) -> bool:
+        if isinstance(other, BaseField):
+            return self.creation_counter >= other.creation_counter
+        return NotImplemented
+
     def __hash__(self) -> int:
-        return hash(self.creation_counter)
+        return self.creation_counter
 
     @deprecated("This methods will be remaed to 'get_field_typ'")
     def _get_type(self) -> TypeScalar | TypeObjectType:  # TypeScalar ??
@@ -108,7 +129,7 @@ class BaseField(PrintingMixin):
 
     @deprecated("This method will be removed in a future version.")
     def reset_counter(self):
-        self.creation_counter = self.increase_counter()
+        self.creation_counter = next_creation_counter()
 
 
 class ExplicitField(BaseField, metaclass=BaseFieldType):  # MountedType
@@ -136,12 +157,16 @@ class ExplicitField(BaseField, metaclass=BaseFieldType):  # MountedType
     - Union
     """
 
+    __slots__ = ('field_type',)
+
     is_mounted: bool = True
 
     def __init__(self, field_type: Type[TypeScalar | TypeObjectType], *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        if not inspect.isclass(field_type) and not issubclass(field_type, (TypeScalar, TypeObjectType)):
+        # TypeScalar and TypeObjectType are type aliases which can not be
+        # used with issubclass so only the field type being a class is checked
+        if not isinstance(field_type, type):
             raise TypeError(
                 f"Expected a class of type TypeScalar or TypeObjectType, "
                 f"got {type(field_type).__name__}"
@@ -220,19 +245,20 @@ class ImplicitField(BaseField, metaclass=BaseFieldType):  # UnmountedType
         counter (int, optional): The creation counter for the field. If not provided, it will be automatically assigned.
     """
 
+    __slots__ = ()
+
     def __repr__(self):
         return self.print_field(self)
 
     def __eq__(self, other: TypeFieldType | Any) -> bool:
-        truth_array = [
-            isinstance(other, ImplicitField),
-            all([
-                self.get_type() == other.get_type(),
-                self.args == other.args,
-                self.kwargs == other.kwargs
-            ])
-        ]
-        return any(truth_array)
+        if not isinstance(other, ImplicitField):
+            return NotImplemented
+
+        return (
+            self._get_type() == other._get_type() and
+            self.args == other.args and
+            self.kwargs == other.kwargs
+        )
 
     def _mount_as(self, instance):
         pass
@@ -247,6 +273,19 @@ class ImplicitField(BaseField, metaclass=BaseFieldType):  # UnmountedType
         pass
 
 
+@functools.lru_cache(maxsize=256)
+def get_field_kind(klass: type) -> Optional[type[BaseField]]:
+    """Returns the kind of field (`ExplicitField` or `ImplicitField`) for
+    the given class or None if the class is not a field. The result only 
+    depends on the class so it is cached. The cache is bounded since it
+    would otherwise keep alive the classes created dynamically."""
+    if issubclass(klass, ExplicitField):
+        return ExplicitField
+    elif issubclass(klass, ImplicitField):
+        return ImplicitField
+    return None
+
+
 def mount_type_as(value: TypeFieldType, mount_type: Optional[ExplicitField] = None):
     """Mount an `ImplicitField` as an `ExplicitField` (e.g. `Field`).
 
@@ -256,9 +295,10 @@ def mount_type_as(value: TypeFieldType, mount_type: Optional[ExplicitField] = No
         result = mount_type_as(String, mount_type=Field)
         assert isinstance(result, Field)
     """
-    if isinstance(value, ExplicitField):
+    kind = get_field_kind(type(value))
+    if kind is ExplicitField:
         return value
-    elif isinstance(value, ImplicitField):
+    elif kind is ImplicitField:
         if mount_type is None:
             return value
         return mount_type.create_new_field(value)
@@ -5,3 +5,5 @@ class InputField(ImplicitField):
     """An `InputField` is used to define fields on `InputObjectType`. 
     It is similar to `graphene.Field` but with some differences.
     """
+
+    __slots__ = ()
@@ -1,10 +1,10 @@
-from typing import Any, Callable, MutableMapping
+import functools
+from typing import Any, Callable, MutableMapping, Optional
 
 from graphql import GraphQLResolveInfo
 
 from new_graphene.typings import TypeAllTypes, TypeResolver
 
-
 def attribute_resolver(name: str, default_value: TypeAllTypes, root: MutableMapping[str, Any], info: GraphQLResolveInfo, **arguments: Any):
     return getattr(root, name, default_value)
 
@@ -38,5 +38,69 @@ def default_resolver() -> Callable[..., TypeResolver]:
     return resolver
 
 
-def source_resolver(source: str, root: MutableMapping[str, Any], info: GraphQLResolveInfo, **arguments: Any):
-    return root
+def simple_resolver(name: str, default_value: TypeAllTypes) -> TypeResolver:
+    """Returns a resolver bound to a single field which reads the value from 
+    a dictionary or an object without going through the `default_resolver` 
+    dispatch. This is used for fields that do not define a custom `resolve_` 
+    method and whose ObjectType does not define a custom default resolver.
+
+    Args:
+        name (str): The name of the field being resolved.
+        default_value (Any): The default value to return if the field cannot be resolved.
+    """
+    def resolver(root: MutableMapping[str, Any], info: GraphQLResolveInfo, **arguments: Any):
+        if isinstance(root, dict):
+            return root.get(name, default_value)
+        return getattr(root, name, default_value)
+    return resolver
+
+
+def simple_dict_resolver(name: str, default_value: TypeAllTypes) -> TypeResolver:
+    """Returns a resolver bound to a single field which only reads the 
+    value from a dictionary. This skips the attribute lookup fallback 
+    for ObjectTypes which declare `dict_resolver` as their default resolver."""
+    def resolver(root: MutableMapping[str, Any], info: GraphQLResolveInfo, **arguments: Any):
+        return root.get(name, default_value)
+    return resolver
+
+
+def bind_default_resolver(resolver: Optional[TypeResolver], name: str, default_value: TypeAllTypes) -> TypeResolver:
+    """Binds the default resolver of an ObjectType to a single field. The 
+    builtin resolvers are replaced by their per-field specialized version
+    and custom resolvers are called with the field name and default value.
+
+    Args:
+        resolver (Callable, optional): The default resolver defined on the ObjectType.
+        name (str): The name of the field being resolved.
+        default_value (Any): The default value to return if the field cannot be resolved.
+    """
+    if resolver is None:
+        return simple_resolver(name, default_value)
+
+    if resolver is dict_resolver:
+        return simple_dict_resolver(name, default_value)
+    return functools.partial(resolver, name, default_value)
+
+
+def source_resolver(source: str, default_value: TypeAllTypes = None) -> TypeResolver:
+    """Returns a resolver bound to a single field which reads the value 
+    from the `source` key or attribute of the parent object. This is used
+    for fields created with `Field(..., source='name')`.
+
+    Args:
+        source (str): The key or attribute of the parent object to read.
+        default_value (Any): The default value to return if the source cannot be resolved.
+    """
+    def resolver(root: MutableMapping[str, Any], info: GraphQLResolveInfo, **arguments: Any):
+        if isinstance(root, dict):
+            return root.get(source, default_value)
+        return getattr(root, source, default_value)
+    return resolver
+
+
+@functools.lru_cache(maxsize=256)
+def shared_source_resolver(source: str) -> TypeResolver:
+    """Returns the `source_resolver` without a default value for the given 
+    source. The resolvers do not hold any state so the fields reading the
+    same key or attribute (e.g. `id` or `name`) share the same function."""
+    return source_resolver(source)
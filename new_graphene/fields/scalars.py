@@ -1,10 +1,11 @@
 import datetime
+import functools
 from decimal import Decimal as PythonDecimal
-from typing import Any, ClassVar, Optional, Type
+from typing import Any, Callable, ClassVar, Optional, Type
 
-import graphql
 from graphql import (BooleanValueNode, FloatValueNode, IntValueNode,
-                     StringValueNode, Undefined, ValueNode)
+                     ListValueNode, ObjectValueNode, StringValueNode,
+                     Undefined, ValueNode)
 from graphql.error import GraphQLError
 
 from new_graphene.fields.helpers import ImplicitField
@@ -15,6 +16,25 @@ MAX_INT = 2147483647
 MIN_INT = -2147483648
 
 
+# The dates are immutable so the same values sent in the
+# queries can be parsed once. Invalid values raise a ValueError
+# which is not cached by lru_cache
+parse_iso_date = functools.lru_cache(maxsize=4096)(datetime.date.fromisoformat)
+
+parse_iso_datetime = functools.lru_cache(maxsize=4096)(datetime.datetime.fromisoformat)
+
+parse_iso_time = functools.lru_cache(maxsize=4096)(datetime.time.fromisoformat)
+
+
+# The kinds of AST nodes accepted by the scalars
+# which can be parsed from more than one literal
+FLOAT_NODE_TYPES = frozenset({FloatValueNode, IntValueNode})
+
+ID_NODE_TYPES = frozenset({StringValueNode, IntValueNode})
+
+DECIMAL_NODE_TYPES = frozenset({IntValueNode, StringValueNode})
+
+
 class Scalar[T= Any](ImplicitField):
     """A scalar type represents a primitive value in GraphQL. It is used to define fields 
     that return simple values such as strings, numbers, or booleans. Each specific scalar 
@@ -31,6 +51,8 @@ class Scalar[T= Any](ImplicitField):
             age = Scalar()
     """
 
+    __slots__ = ()
+
     internal_type: ClassVar[ObjectTypesEnum] = ObjectTypesEnum.SCALAR
 
     def __repr__(self):
@@ -87,28 +109,36 @@ class Generic(Scalar[Any]):
             age = Generic()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        match node:
-            case StringValueNode():
-                return node.value
-            case graphql.language.ast.BooleanValueNode():
-                return node.value
-            case IntValueNode():
-                num = int(node.value)
-                if MIN_INT <= num <= MAX_INT:
-                    return num
-            case graphql.language.ast.FloatValueNode():
-                return float(node.value)
-            case graphql.language.ast.ListValueNode():
-                return [Generic.parse_literal(value) for value in node.values]
-            case graphql.language.ast.ObjectValueNode():
-                return {
-                    field.name.value: Generic.parse_literal(field.value)
-                    for field in node.fields
-                }
-            case _:
-                return None
+        parser = _GENERIC_LITERAL_PARSERS.get(type(node))
+        if parser is None:
+            return None
+        return parser(node)
+
+
+def _parse_generic_int(node: IntValueNode) -> Optional[int]:
+    num = int(node.value)
+    if MIN_INT <= num <= MAX_INT:
+        return num
+    return None
+
+
+# Maps the type of the AST node to the function which
+# parses it so that Generic only does a single lookup
+_GENERIC_LITERAL_PARSERS: dict[type[ValueNode], Callable[[ValueNode], Any]] = {
+    StringValueNode: lambda node: node.value,
+    BooleanValueNode: lambda node: node.value,
+    IntValueNode: _parse_generic_int,
+    FloatValueNode: lambda node: float(node.value),
+    ListValueNode: lambda node: [Generic.parse_literal(value) for value in node.values],
+    ObjectValueNode: lambda node: {
+        field.name.value: Generic.parse_literal(field.value)
+        for field in node.fields
+    }
+}
 
 
 class Integer(Scalar[int]):
@@ -125,9 +155,11 @@ class Integer(Scalar[int]):
             age = Integer()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, IntValueNode):
+        if type(node) is IntValueNode:
             value = int(node.value)
             if MIN_INT <= value <= MAX_INT:
                 return value
@@ -135,13 +167,16 @@ class Integer(Scalar[int]):
 
     @staticmethod
     def parse_value(value):
-        try:
-            value = int(value)
-        except ValueError:
+        # Most values are already integers and do
+        # not need to be converted before the check
+        if type(value) is not int:
             try:
-                value = int(float(value))
+                value = int(value)
             except ValueError:
-                return Undefined
+                try:
+                    value = int(float(value))
+                except ValueError:
+                    return Undefined
 
         if MIN_INT <= value <= MAX_INT:
             return value
@@ -162,30 +197,28 @@ class BigInteger(Scalar[int]):
             age = BigInteger()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, IntValueNode):
+        if type(node) is IntValueNode:
             return int(node.value)
         return Undefined
 
     @staticmethod
     def parse_value(value):
-        _value = Undefined
+        if type(value) is int:
+            return value
 
         try:
-            _value = int(value)
+            return int(value)
         except ValueError:
             pass
 
-        if _value is not Undefined:
-            return _value
-
         try:
-            _value = int(float(value))
+            return int(float(value))
         except ValueError:
-            pass
-
-        return _value
+            return Undefined
 
 
 class Float(Scalar[float]):
@@ -199,14 +232,19 @@ class Float(Scalar[float]):
             value = Float()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, (FloatValueNode, IntValueNode)):
+        if type(node) in FLOAT_NODE_TYPES:
             return float(node.value)
         return Undefined
 
     @staticmethod
     def parse_value(value):
+        if type(value) is float:
+            return value
+
         try:
             value = float(value)
         except ValueError:
@@ -225,19 +263,24 @@ class String(Scalar[str]):
             name = String()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def serialize(value):
         return value
 
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, StringValueNode):
+        if type(node) is StringValueNode:
             return node.value
         return Undefined
 
     @staticmethod
     def parse_value(value):
-        if isinstance(value, bool):
+        value_type = type(value)
+        if value_type is str:
+            return value
+        if value_type is bool:
             return 'true' if value else 'false'
         return str(value)
 
@@ -253,13 +296,15 @@ class Boolean(Scalar[bool]):
             is_active = Boolean()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def serialize(value):
         return bool(value)
 
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, BooleanValueNode):
+        if type(node) is BooleanValueNode:
             return node.value
         return Undefined
 
@@ -279,9 +324,11 @@ class ID(Scalar[str]):
             id = ID()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, (StringValueNode, IntValueNode)):
+        if type(node) in ID_NODE_TYPES:
             return node.value
         return Undefined
 
@@ -298,9 +345,11 @@ class Date(Scalar[str]):
             date = Date()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, StringValueNode):
+        if type(node) is StringValueNode:
             return node.value
         return Undefined
 
@@ -316,7 +365,7 @@ class Date(Scalar[str]):
             )
 
         try:
-            return datetime.date.fromisoformat(value)
+            return parse_iso_date(value)
         except ValueError:
             raise GraphQLError(f"Date cannot represent value: {repr(value)}")
 
@@ -333,9 +382,11 @@ class DateTime(Scalar[str]):
             date = DateTime()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, StringValueNode):
+        if type(node) is StringValueNode:
             return node.value
         return Undefined
 
@@ -351,7 +402,7 @@ class DateTime(Scalar[str]):
             )
 
         try:
-            return datetime.datetime.fromisoformat(value)
+            return parse_iso_datetime(value)
         except ValueError:
             raise GraphQLError(
                 f"DateTime cannot represent value: {repr(value)}")
@@ -369,9 +420,11 @@ class Time(Scalar[str]):
             time = Time()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, StringValueNode):
+        if type(node) is StringValueNode:
             return node.value
         return Undefined
 
@@ -387,15 +440,7 @@ class Time(Scalar[str]):
             )
 
         try:
-            return datetime.time.fromisoformat(value)
-        except ValueError:
-            raise GraphQLError(
-                f"Time cannot represent value: {repr(value)}")
-            return datetime.time.fromisoformat(value)
-        except ValueError:
-            raise GraphQLError(
-                f"Time cannot represent value: {repr(value)}")
-            return datetime.time.fromisoformat(value)
+            return parse_iso_time(value)
         except ValueError:
             raise GraphQLError(
                 f"Time cannot represent value: {repr(value)}")
@@ -413,14 +458,20 @@ class Decimal(Scalar[str]):
             price = Decimal()
     """
 
+    __slots__ = ()
+
     @staticmethod
     def parse_literal(node, variables=None):
-        if isinstance(node, (IntValueNode, StringValueNode)):
+        if type(node) in DECIMAL_NODE_TYPES:
             return node.value
         return Undefined
 
     @staticmethod
     def parse_value(value):
+        # Decimals are immutable and can be returned as is
+        if type(value) is PythonDecimal:
+            return value
+
         try:
             return PythonDecimal(value)
         except Exception:
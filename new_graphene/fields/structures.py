@@ -10,6 +10,8 @@ class Structure[T = TypeScalar | TypeObjectType](ImplicitField):
     or non-nullable
     """
 
+    __slots__ = ('field_type',)
+
     def __init__(self, field_type: T, *args: TypeArgument, **kwargs: TypeArgument):
         super().__init__(field_type, *args, **kwargs)
 
@@ -40,6 +42,8 @@ class List(Structure):
             firstname = List(String) # Field will be a list of strings
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return f"[{self.field_type}]"
 
@@ -63,6 +67,8 @@ class NonNull(Structure):
             lastname = String(required=True) # Equivalent
     """
 
+    __slots__ = ()
+
     def __str__(self):
         return f"{self.field_type}!"
 
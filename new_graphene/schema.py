@@ -1,20 +1,25 @@
 import functools
 import inspect
+import sys
+import weakref
 from typing import Any, Callable, Optional, Sequence, Type
 
-from graphql import (GraphQLArgument, GraphQLBoolean, GraphQLField,
-                     GraphQLFloat, GraphQLID, GraphQLInputField, GraphQLInt,
+from graphql import (DocumentNode, ExecutionResult, GraphQLArgument,
+                     GraphQLBoolean, GraphQLError, GraphQLField, GraphQLFloat,
+                     GraphQLID, GraphQLInputField, GraphQLInt,
                      GraphQLNamedType, GraphQLObjectType, GraphQLResolveInfo,
-                     GraphQLSchema, GraphQLString, default_type_resolver,
-                     get_introspection_query)
-from graphql import graphql as agraphql
-from graphql import graphql_sync
+                     GraphQLSchema, GraphQLString, Source,
+                     default_type_resolver, execute, execute_sync,
+                     get_introspection_query, parse, validate,
+                     validate_schema)
+from graphql.pyutils import is_awaitable
 
+from new_graphene.compiler import CompiledQuery
 from new_graphene.exceptions import GrapheneObjectTypeError
 from new_graphene.fields.dynamic import Dynamic
 from new_graphene.fields.interface import Interface
 from new_graphene.fields.objecttypes import ObjectType
-from new_graphene.fields.resolvers import default_resolver
+from new_graphene.fields.resolvers import bind_default_resolver
 # from new_graphene.fields.datatypes import ID, Float, Integer, Scalar, String
 from new_graphene.fields.scalars import Scalar
 from new_graphene.grapqltypes import (GrapheneGraphqlObjectType,
@@ -128,18 +133,17 @@ class TypesContainer(dict):
             return None
 
         _resolver = getattr(graphene_type, func_name, None)
+        if _resolver is not None:
+            return get_unbound_function(_resolver)
 
-        interface_resolver = None
         for interface in graphene_type._meta.interfaces:
             if field_name not in interface._meta.fields:
                 continue
 
             interface_resolver = getattr(interface, func_name, None)
             if interface_resolver is not None:
-                break
-        
-        resolver = _resolver or interface_resolver
-        return get_unbound_function(resolver)
+                return get_unbound_function(interface_resolver)
+        return None
 
     # create_fields_for_type
     def _create_fields(self, graphene_type: Type[TypeObjectType], is_input_field: bool = False):
@@ -206,9 +210,10 @@ class TypesContainer(dict):
                     field_default_resolver = resolve_for_subscription
 
                 if issubclass(graphene_type, ObjectType):
-                    _resolver = graphene_type._meta.default_resolver or default_resolver()
-                    field_default_resolver = functools.partial(
-                        _resolver, name, field_obj.default_value
+                    field_default_resolver = bind_default_resolver(
+                        graphene_type._meta.default_resolver,
+                        name,
+                        field_obj.default_value
                     )
 
                 func_resolver = self._get_field_resolver(
@@ -230,7 +235,7 @@ class TypesContainer(dict):
                     deprecation_reason=field_obj.deprecation_reason
                 )
 
-            field_name = field_obj.name or self._get_name(name)
+            field_name = sys.intern(field_obj.name or self._get_name(name))
             _final_fields[field_name] = _final_field
 
         return _final_fields
@@ -382,6 +387,34 @@ class TypesContainer(dict):
         pass
 
 
+def validate_document(graphql_schema: GraphQLSchema, document: DocumentNode) -> tuple[GraphQLError, ...]:
+    schema_validation_errors = validate_schema(graphql_schema)
+    if schema_validation_errors:
+        return tuple(schema_validation_errors)
+    return tuple(validate(graphql_schema, document))
+
+
+def parse_and_validate(graphql_schema: GraphQLSchema, source: str | Source) -> tuple[Optional[DocumentNode], tuple[GraphQLError, ...]]:
+    """Parses and validates the query against the schema. Errors are
+    returned alongside the document so that invalid queries are also
+    cached and do not go through the validation step again. The errors
+    are returned as a tuple since the cached value is shared."""
+    try:
+        document = parse(source)
+    except GraphQLError as error:
+        return None, (error,)
+
+    validation_errors = validate_document(graphql_schema, document)
+    if validation_errors:
+        return None, validation_errors
+    return document, ()
+
+
+def compile_query(graphql_schema: GraphQLSchema, get_document: Callable[[str], tuple[Optional[DocumentNode], tuple[GraphQLError, ...]]], query: str, operation_name: Optional[str] = None) -> CompiledQuery:
+    document, errors = get_document(query)
+    return CompiledQuery(graphql_schema, document, errors, operation_name)
+
+
 class Schema(PrintingMixin):
     """A schema can be defined as a class that contains the root types
     for the GraphQL schema, such as query, mutation, and subscription. It also can contain
@@ -406,6 +439,7 @@ class Schema(PrintingMixin):
         types (Sequence[Type[TypeObjectType]], optional): A list of additional types used in the schema. Defaults to None.
         directives (Sequence, optional): A list of directives used in the schema. Defaults to None. 
         auto_camelcase (bool, optional): Whether to automatically convert field names to camel case. Defaults to True.
+        document_cache_size (int, optional): Maximum number of parsed and validated query documents kept in memory. Use 0 to disable the cache or None for an unbounded cache. Defaults to 512.
     """
 
     def __init__(
@@ -415,7 +449,8 @@ class Schema(PrintingMixin):
         subscription: Optional[Type[TypeObjectType]] = None, 
         types: Optional[Sequence[Type[TypeObjectType]]] = None, 
         directives: Optional[Sequence] = None, 
-        auto_camelcase: bool = True
+        auto_camelcase: bool = True,
+        document_cache_size: Optional[int] = 512
     ):
         self.query = query
         self.mutation = mutation
@@ -431,6 +466,8 @@ class Schema(PrintingMixin):
             auto_camelcase=auto_camelcase
         )
 
+        # The GraphQL schema is built once, so that the construction
+        # errors are raised here, and is then shared by every execution
         self.graphql_schema = GraphQLSchema(
             query=self._types_container.query,
             mutation=self._types_container.mutation,
@@ -439,6 +476,19 @@ class Schema(PrintingMixin):
             directives=directives
         )
 
+        # Parsing and validating a query string is pure with respect
+        # to the schema, so repeated queries reuse the cached document.
+        # The caches are bound to the GraphQL schema and not to this
+        # instance which would otherwise reference itself
+        self.document_cache_size = document_cache_size
+        self._cached_document = functools.lru_cache(
+            maxsize=document_cache_size
+        )(functools.partial(parse_and_validate, self.graphql_schema))
+        self._validated_documents: weakref.WeakKeyDictionary[DocumentNode, tuple[GraphQLError, ...]] = weakref.WeakKeyDictionary()
+        self._cached_compiled_query = functools.lru_cache(
+            maxsize=document_cache_size
+        )(functools.partial(compile_query, self.graphql_schema, self._cached_document))
+
     def __str__(self) -> str:
         return self.print_schema(self)
 
@@ -463,6 +513,55 @@ class Schema(PrintingMixin):
 
         return new_kwargs
 
+    def get_document(self, source: str | Source | DocumentNode) -> tuple[Optional[DocumentNode], Sequence[GraphQLError]]:
+        """Returns the parsed and validated document for the given query. 
+        Query strings are served from the document cache and already parsed 
+        documents are only validated once.
+
+        .. code-block:: python
+            from graphql import parse
+
+            document = parse('{ users { name } }')
+            for _ in range(1000):
+                schema.execute(document)
+        """
+        if isinstance(source, DocumentNode):
+            errors = self._validated_documents.get(source)
+            if errors is None:
+                errors = validate_document(self.graphql_schema, source)
+                self._validated_documents[source] = errors
+            return (None, list(errors)) if errors else (source, [])
+
+        if isinstance(source, str):
+            document, errors = self._cached_document(source)
+        else:
+            document, errors = parse_and_validate(self.graphql_schema, source)
+        return document, list(errors)
+
+    def clear_document_cache(self):
+        """Empties the cache of parsed and validated documents"""
+        self._cached_document.cache_clear()
+        self._validated_documents.clear()
+        self._cached_compiled_query.cache_clear()
+
+    def compile(self, query: str | Source | DocumentNode, operation_name: Optional[str] = None) -> CompiledQuery:
+        """Compiles the query into a specialized Python function where the 
+        selection set is unrolled into direct calls to the resolvers. This is 
+        useful for queries that are executed many times. Compiled query strings 
+        are cached.
+
+        .. code-block:: python
+            compiled_query = schema.compile('{ users { name } }')
+            result = compiled_query(context={'user': 1}, variables={})
+
+        Args:
+            query: The GraphQL query string or an already parsed `DocumentNode` to compile.
+            operation_name (str, optional): The name of the operation to compile if the query contains multiple operations.
+        """
+        if isinstance(query, str):
+            return self._cached_compiled_query(query, operation_name)
+        return compile_query(self.graphql_schema, self.get_document, query, operation_name)
+
     def to_lazy(self, item):
         return lambda: item
 
@@ -483,22 +582,26 @@ class Schema(PrintingMixin):
             )
         return result.data
 
-    def execute(self, *args: TypeGraphqlExecuteOptions, **kwargs: TypeGraphqlExecuteOptions):
+    def execute(self, query: str | Source | DocumentNode, *args: TypeGraphqlExecuteOptions, **kwargs: TypeGraphqlExecuteOptions):
         """Executes a GraphQL query against the schema.
 
         Args:
-            *args: Positional arguments to be passed to the graphql_sync function.
-            **kwargs: Keyword arguments to be passed to the graphql_sync function. These can include:
-                - query: The GraphQL query string to execute.
+            query: The GraphQL query string or an already parsed `DocumentNode` to execute. Query strings are parsed and validated once and then served from the document cache.
+            *args: Positional arguments to be passed to the execute_sync function.
+            **kwargs: Keyword arguments to be passed to the execute_sync function. These can include:
                 - variables: A dictionary of variables to be used in the query.
                 - context: A value to be passed as the context to the resolvers.
                 - root: A value to be passed as the root value to the resolvers.
                 - operation_name: The name of the operation to execute (if the query contains multiple operations)
         """
         normalized_kwargs = self._normalize_kwargs(**kwargs)
-        return graphql_sync(self.graphql_schema, *args, **normalized_kwargs)
 
-    def aexecute(self, *args: TypeGraphqlExecuteOptions, **kwargs: TypeGraphqlExecuteOptions):
+        document, errors = self.get_document(query)
+        if errors:
+            return ExecutionResult(data=None, errors=errors)
+        return execute_sync(self.graphql_schema, document, *args, **normalized_kwargs)
+
+    async def aexecute(self, query: str | Source | DocumentNode, *args: TypeGraphqlExecuteOptions, **kwargs: TypeGraphqlExecuteOptions):
         """Asynchronous version of the execute method. 
         This method is intended to be used in an asynchronous context, such as with 
         an async web framework or in an async resolver. It allows for executing GraphQL 
@@ -506,16 +609,24 @@ class Schema(PrintingMixin):
         with I/O-bound operations or long-running tasks.
 
         Args:
-            *args: Positional arguments to be passed to the graphql_sync function.
-            **kwargs: Keyword arguments to be passed to the graphql_sync function. These can include:
-                - query: The GraphQL query string to execute.
+            query: The GraphQL query string or an already parsed `DocumentNode` to execute. Query strings are parsed and validated once and then served from the document cache.
+            *args: Positional arguments to be passed to the execute function.
+            **kwargs: Keyword arguments to be passed to the execute function. These can include:
                 - variables: A dictionary of variables to be used in the query.
                 - context: A value to be passed as the context to the resolvers.
                 - root: A value to be passed as the root value to the resolvers.
                 - operation_name: The name of the operation to execute (if the query contains multiple operations)
         """
         normalized_kwargs = self._normalize_kwargs(**kwargs)
-        return agraphql(self.graphql_schema, *args, **normalized_kwargs)
+
+        document, errors = self.get_document(query)
+        if errors:
+            return ExecutionResult(data=None, errors=errors)
+
+        result = execute(self.graphql_schema, document, *args, **normalized_kwargs)
+        if is_awaitable(result):
+            return await result
+        return result
 
     def asubscribe(self, query, *args, **kwargs):
         pass
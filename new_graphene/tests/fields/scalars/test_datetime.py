@@ -0,0 +1,28 @@
+import datetime
+import unittest
+
+from graphql import GraphQLError
+
+from new_graphene.fields.scalars import Date, DateTime, Time, parse_iso_date
+
+
+class TestDateTime(unittest.TestCase):
+    def test_parse_value(self):
+        values = [
+            (Date, '2024-01-31', datetime.date(2024, 1, 31)),
+            (DateTime, '2024-01-31T10:30:00', datetime.datetime(2024, 1, 31, 10, 30)),
+            (Time, '10:30:00', datetime.time(10, 30))
+        ]
+
+        for scalar, value, expected in values:
+            with self.subTest(scalar=scalar):
+                self.assertEqual(scalar.parse_value(value), expected)
+
+                with self.assertRaises(GraphQLError):
+                    scalar.parse_value('Kendall')
+
+    def test_parse_value_is_cached(self):
+        parse_iso_date.cache_clear()
+        Date.parse_value('2024-01-31')
+        Date.parse_value('2024-01-31')
+        self.assertEqual(parse_iso_date.cache_info().hits, 1)
@@ -0,0 +1,18 @@
+import unittest
+from decimal import Decimal as PythonDecimal
+
+from graphql import Undefined
+
+from new_graphene.fields.scalars import Decimal
+
+
+class TestDecimal(unittest.TestCase):
+    def test_parse_value(self):
+        value = PythonDecimal('10.5')
+        self.assertIs(Decimal.parse_value(value), value)
+
+        for value, expected in [('10.5', PythonDecimal('10.5')), (3, PythonDecimal(3))]:
+            with self.subTest(value=value):
+                self.assertEqual(Decimal.parse_value(value), expected)
+
+        self.assertIs(Decimal.parse_value('Kendall'), Undefined)
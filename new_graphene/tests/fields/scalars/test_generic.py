@@ -0,0 +1,23 @@
+import unittest
+
+from graphql import parse_value
+
+from new_graphene.fields.scalars import Generic
+
+
+class TestGeneric(unittest.TestCase):
+    def test_parse_literal(self):
+        values = [
+            ('"Kendall"', 'Kendall'),
+            ('true', True),
+            ('27', 27),
+            ('1.5', 1.5),
+            ('2147483648', None),
+            ('[1, "a", [false]]', [1, 'a', [False]]),
+            ('{name: "Kendall", ages: [27]}', {'name': 'Kendall', 'ages': [27]}),
+            ('null', None)
+        ]
+
+        for literal, expected in values:
+            with self.subTest(literal=literal):
+                self.assertEqual(Generic.parse_literal(parse_value(literal)), expected)
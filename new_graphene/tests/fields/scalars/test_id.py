@@ -0,0 +1,12 @@
+import unittest
+
+from graphql import BooleanValueNode, IntValueNode, StringValueNode, Undefined
+
+from new_graphene.fields.scalars import ID
+
+
+class TestID(unittest.TestCase):
+    def test_parse_literal(self):
+        self.assertEqual(ID.parse_literal(StringValueNode(value='abc')), 'abc')
+        self.assertEqual(ID.parse_literal(IntValueNode(value='1')), '1')
+        self.assertIs(ID.parse_literal(BooleanValueNode(value=True)), Undefined)
@@ -42,6 +42,15 @@ class TestInteger(unittest.TestCase):
             with self.subTest(value=value):
                 self.assertEqual(result, Undefined)
 
+    def test_parse_value(self):
+        for value, expected in [(27, 27), ('27', 27), ('2.0', 2), (True, 1)]:
+            with self.subTest(value=value):
+                self.assertEqual(Integer.parse_value(value), expected)
+
+        for value in undefined_values:
+            with self.subTest(value=value):
+                self.assertIs(Integer.parse_value(value), Undefined)
+
 
 class TestBigInteger(unittest.TestCase):
     def test_value_resolution(self):
@@ -50,3 +59,13 @@ class TestBigInteger(unittest.TestCase):
                 result = BigInteger.resolve_value(value)
                 self.assertIsInstance(
                     result, (int, float), f"2/Expected {value} to be invalid for BigInteger")
+
+    def test_parse_value(self):
+        value = 2**40
+        self.assertIs(BigInteger.parse_value(value), value)
+
+        for value, expected in [('12', 12), ('2.0', 2), (3.7, 3)]:
+            with self.subTest(value=value):
+                self.assertEqual(BigInteger.parse_value(value), expected)
+
+        self.assertIs(BigInteger.parse_value('Kendall'), Undefined)
@@ -9,7 +9,6 @@ class TestScalar(unittest.TestCase):
     def test_value_resolution(self):
         result = Scalar.parse_value("test")
         self.assertEqual(result, "test")
-        self.assertEqual(Scalar.creation_counter, 1)
         self.assertEqual(Scalar.internal_type, ObjectTypesEnum.SCALAR)
 
     def test_internal_type_other_scalar(self):
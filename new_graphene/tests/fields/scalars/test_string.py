@@ -1,5 +1,6 @@
 import unittest
 
+from graphql import IntValueNode, StringValueNode, Undefined
 from tests.global_utils import create_test_schema
 
 from new_graphene.fields.arguments import Argument
@@ -12,6 +13,15 @@ class TestString(unittest.TestCase):
         field_type = instance._get_type()
         print(instance.args, instance.kwargs, field_type)
 
+    def test_parse_value(self):
+        for value, expected in [('John', 'John'), (True, 'true'), (False, 'false'), (27, '27')]:
+            with self.subTest(value=value):
+                self.assertEqual(String.parse_value(value), expected)
+
+    def test_parse_literal(self):
+        self.assertEqual(String.parse_literal(StringValueNode(value='John')), 'John')
+        self.assertIs(String.parse_literal(IntValueNode(value='1')), Undefined)
+
     def test_query(self):
         result = create_test_schema()
         self.assertIsNone(result.errors)
@@ -1,6 +1,7 @@
 import unittest
 
 from new_graphene.fields.arguments import Argument
+from new_graphene.fields.base import Field
 from new_graphene.fields.scalars import String
 
 
@@ -23,6 +24,12 @@ class TestArgument(unittest.TestCase):
         self.assertEqual(instance.name, "test_arg")
         self.assertTrue(instance.required)
 
+    def test_equality(self):
+        self.assertEqual(Argument(String, name='search'), Argument(String, name='search'))
+        self.assertNotEqual(Argument(String, name='search'), Argument(String, name='other'))
+        self.assertNotEqual(Argument(String, required=True), Argument(String))
+        self.assertNotEqual(Argument(String), 'search')
+
     def test_argument_translation(self):
         # With string
         result = Argument.translate_arguments({'name': 'String'})
@@ -32,6 +39,22 @@ class TestArgument(unittest.TestCase):
         result = Argument.translate_arguments({'name': String()})
         self.assertIn('name', result)
 
+    def test_field_translation(self):
+        field = Field(String, args={'firstname': Argument(String)}, lastname=String())
+        result = Argument.translate_arguments(field)
+        self.assertEqual(list(result), ['firstname', 'lastname'])
+        self.assertEqual(result, field._arguments)
+
+    def test_arguments_are_not_shared(self):
+        argument = Argument(String)
+        result = Argument.translate_arguments({'search': argument})
+        other_result = Argument.translate_arguments({'query': argument})
+
+        self.assertIsNone(argument.name)
+        self.assertEqual(result['search'].name, 'search')
+        self.assertEqual(other_result['query'].name, 'query')
+        self.assertEqual(result['search'].creation_counter, argument.creation_counter)
+
     def test_with_both_args_and_extra_args(self):
         # With args
         result = Argument.translate_arguments(
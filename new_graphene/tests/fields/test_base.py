@@ -1,3 +1,4 @@
+import sys
 import unittest
 
 from new_graphene.base import BaseOptions, BaseType, BaseTypeMetaclass
@@ -19,6 +20,14 @@ class TestBaseOptions(unittest.TestCase):
             "<BaseTypeOptions for BaseType>"
         )
 
+    def test_base_options_slots(self):
+        options = BaseOptions(BaseType)
+        self.assertFalse(hasattr(options, '__dict__'))
+        self.assertFalse(options.abstract)
+
+        with self.assertRaises(AttributeError):
+            options.unknown_option = True
+
     def test_check_meta_options(self):
         class SimpleType(ObjectType):
             class Meta:
@@ -26,7 +35,9 @@ class TestBaseOptions(unittest.TestCase):
                 description = 'A simple type for testing'
 
         options = BaseOptions(SimpleType)
-        options.check_meta_options(SimpleType._meta._base_meta.__dict__.keys())
+        keys = options.check_meta_options(SimpleType._meta._base_meta.__dict__.keys())
+        self.assertEqual(keys, {'name', 'description'})
+        self.assertEqual(SimpleType._meta.description, 'A simple type for testing')
 
     @unittest.expectedFailure
     def test_check_meta_options_invalid_option(self):
@@ -67,6 +78,14 @@ class TestBaseOptions(unittest.TestCase):
         for item in options.fields.values():
             self.assertIsInstance(item, Field)
 
+    def test_mount_fields(self):
+        options = BaseOptions(ObjectType)
+        options.mount_fields({'name': String(), 'age': Field(String)})
+
+        self.assertEqual(list(options.fields), ['name', 'age'])
+        for item in options.fields.values():
+            self.assertIsInstance(item, Field)
+
     def test_add_field(self):
         class SimpleType(ObjectType):
             pass
@@ -78,6 +97,16 @@ class TestBaseOptions(unittest.TestCase):
         self.assertIn('new_field', options.fields)
         self.assertIs(options.fields['new_field'], new_field)
 
+    def test_field_names_are_interned(self):
+        class SimpleType(ObjectType):
+            pass
+
+        options = BaseOptions(SimpleType)
+        options.add_field(''.join(['dynamic', '_field']), Field(String))
+
+        key = next(iter(options.fields))
+        self.assertIs(key, sys.intern('dynamic_field'))
+
 
 class TestBaseType(unittest.TestCase):
     def test_base_type(self):
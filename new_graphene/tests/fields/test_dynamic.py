@@ -1,3 +1,4 @@
+import functools
 import unittest
 
 from new_graphene.fields.dynamic import Dynamic
@@ -10,3 +11,28 @@ class TestDynamic(unittest.TestCase):
 
         self.assertEqual(dynamic._get_type(), String)
         self.assertEqual(str(dynamic._get_type()), "String")
+
+    def test_type_is_cached(self):
+        calls = []
+
+        def lazy_type():
+            calls.append(1)
+            return String
+
+        dynamic = Dynamic(lazy_type)
+        dynamic._get_type()
+        self.assertIs(dynamic._get_type(), String)
+        self.assertEqual(len(calls), 1)
+
+    def test_undefined_type_is_not_cached(self):
+        field_types = [None, String]
+        dynamic = Dynamic(lambda: field_types.pop(0))
+
+        self.assertIsNone(dynamic._get_type())
+        self.assertIs(dynamic._get_type(), String)
+
+    def test_lazy_type_must_be_a_function(self):
+        self.assertIs(Dynamic(functools.partial(lambda: String))._get_type(), String)
+
+        with self.assertRaises(TypeError):
+            Dynamic(String)
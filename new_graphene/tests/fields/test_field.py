@@ -2,6 +2,7 @@ import unittest
 
 from new_graphene.fields.arguments import Argument
 from new_graphene.fields.base import Field
+from new_graphene.fields.helpers import EMPTY_MAPPING
 from new_graphene.fields.scalars import String
 
 
@@ -49,3 +50,41 @@ class TestField(unittest.TestCase):
     def test_passing_a_none_type(self):
         with self.assertRaises(TypeError):
             Field(None)
+
+    def test_slots(self):
+        instances = [
+            Field(String),
+            Argument(String),
+            String()
+        ]
+        for instance in instances:
+            with self.subTest(instance=instance):
+                self.assertFalse(hasattr(instance, '__dict__'))
+
+    def test_ordering(self):
+        field1 = Field(String)
+        field2 = Field(String)
+        field1.creation_counter = 1
+        field2.creation_counter = 2
+
+        self.assertLess(field1, field2)
+        self.assertLessEqual(field1, field2)
+        self.assertGreater(field2, field1)
+        self.assertGreaterEqual(field2, field1)
+        self.assertEqual(sorted([field2, field1]), [field1, field2])
+        self.assertEqual(hash(field2), 2)
+
+    def test_empty_arguments_are_shared(self):
+        instance = Field(String)
+        self.assertIs(instance.args, EMPTY_MAPPING)
+        self.assertIs(instance.extra_args, EMPTY_MAPPING)
+        self.assertIs(instance._arguments, EMPTY_MAPPING)
+
+        with self.assertRaises(TypeError):
+            instance.args['search'] = Argument(String)
+
+    def test_get_type(self):
+        self.assertIs(Field(String)._get_type(), String)
+
+        instance = Field(String, required=True)
+        self.assertIs(instance._get_type(), instance.field_type)
@@ -2,9 +2,9 @@ import unittest
 
 from new_graphene.fields.base import Field
 from new_graphene.fields.helpers import (BaseField, ExplicitField,
-                                         ImplicitField, inspect_type,
-                                         mount_type_as)
-from new_graphene.fields.scalars import String
+                                         ImplicitField, get_field_kind,
+                                         inspect_type, mount_type_as)
+from new_graphene.fields.scalars import Integer, String
 from new_graphene.fields.structures import List, NonNull
 
 
@@ -41,11 +41,9 @@ class TestBaseField(unittest.TestCase):
         field = BaseField(counter=1)
         self.assertEqual(field.creation_counter, 1)
 
-        field.increase_counter()
-        self.assertEqual(field.creation_counter, 2)
-
+        other_field = BaseField()
         field.reset_counter()
-        self.assertEqual(field.creation_counter, 3)
+        self.assertGreater(field.creation_counter, other_field.creation_counter)
 
 
 class TestExplicitField(unittest.TestCase):
@@ -53,6 +51,12 @@ class TestExplicitField(unittest.TestCase):
         instance = ExplicitField(String)
         print(instance)
 
+    def test_field_type_must_be_a_class(self):
+        for value in [String(), 'String', 123]:
+            with self.subTest(value=value):
+                with self.assertRaisesRegex(TypeError, 'Expected a class'):
+                    ExplicitField(value)
+
     def test_mount(self):
         field = ExplicitField.create_new_field(String())
         self.assertIsInstance(field, ExplicitField)
@@ -75,6 +79,19 @@ class TestImplicitField(unittest.TestCase):
         instance = ImplicitField(resolver=return_resolver_input)
         print(instance)
 
+    def test_options(self):
+        self.assertEqual(String._meta.name, 'String')
+        self.assertEqual(String._meta._internal_name, 'String')
+        self.assertIsNone(String._meta.description)
+        self.assertFalse(hasattr(String._meta, '__dict__'))
+
+    def test_equality(self):
+        self.assertEqual(String(), String())
+        self.assertEqual(String(description='Name'), String(description='Name'))
+        self.assertNotEqual(String(), Integer())
+        self.assertNotEqual(String(description='Name'), String())
+        self.assertNotEqual(String(), 'String')
+
 
 class TestField(unittest.TestCase):
     def test_instance(self):
@@ -150,3 +167,14 @@ class TestGetFieldAs(unittest.TestCase):
 
         result = mount_type_as(CustomType())
         self.assertIsNone(result)
+
+    def test_field_kind(self):
+        self.assertIs(get_field_kind(String), ImplicitField)
+        self.assertIs(get_field_kind(Field), ExplicitField)
+        self.assertIsNone(get_field_kind(int))
+
+        get_field_kind.cache_clear()
+        mount_type_as(String())
+        mount_type_as(String())
+        self.assertEqual(get_field_kind.cache_info().hits, 1)
+        self.assertIsNotNone(get_field_kind.cache_info().maxsize)
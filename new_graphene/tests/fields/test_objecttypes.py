@@ -245,6 +245,38 @@ class TestObjectType(unittest.TestCase):
         self.assertIn('firstname', MyType._meta.fields)
         self.assertIn('lastname', MyType._meta.fields)
 
+    def test_field_overrides_interface_field(self):
+        class MyInterface(Interface):
+            firstname = String()
+            lastname = String()
+
+        overridden_field = Field(String, description='Overridden')
+
+        class MyType(ObjectType):
+            firstname = overridden_field
+
+            class Meta:
+                interfaces = [MyInterface]
+
+        self.assertIs(MyType._meta.fields['firstname'], overridden_field)
+        self.assertEqual(list(MyType._meta.fields), ['firstname', 'lastname'])
+
+    def test_interface_fields_order(self):
+        class MyInterface(Interface):
+            a = String()
+            b = String()
+
+        class MyType(ObjectType):
+            x = String()
+            b = Field(String, description='Overridden')
+            y = String()
+
+            class Meta:
+                interfaces = [MyInterface]
+
+        self.assertEqual(list(MyType._meta.fields), ['x', 'b', 'y', 'a'])
+        self.assertEqual(MyType._meta.fields['b'].description, 'Overridden')
+
     def test_call(self):
         class MyObjectType(ObjectType):
             firstname = String()
@@ -253,3 +285,41 @@ class TestObjectType(unittest.TestCase):
         result = instance(firstname="value")
         self.assertTrue(dataclasses.is_dataclass(result))
         self.assertEqual(result.firstname, "value")
+
+    def test_dataclass_model_is_cached(self):
+        class MyObjectType(ObjectType):
+            firstname = String()
+
+        self.assertNotIn('_dataclass_model', MyObjectType.__dict__)
+
+        model = MyObjectType.dataclass_model
+        self.assertTrue(dataclasses.is_dataclass(model))
+        self.assertIs(MyObjectType.__dict__['_dataclass_model'], model)
+        self.assertIs(MyObjectType.dataclass_model, model)
+        self.assertEqual(model.__slots__, ('firstname',))
+
+    def test_dataclass_model_of_subclass(self):
+        class Parent(ObjectType):
+            firstname = String()
+
+        parent_model = Parent.dataclass_model
+
+        class Child(Parent):
+            lastname = String()
+
+        self.assertIsNot(Child.dataclass_model, parent_model)
+        self.assertIs(Parent.dataclass_model, parent_model)
+
+        result = Child()(lastname='b')
+        self.assertEqual(result.lastname, 'b')
+
+    def test_representation(self):
+        class MyObjectType(ObjectType):
+            firstname = String()
+
+            class Meta:
+                name = 'Other'
+
+        instance = MyObjectType()
+        self.assertEqual(repr(instance), '<Other :: MyObjectType>')
+        self.assertEqual(str(instance), repr(instance))
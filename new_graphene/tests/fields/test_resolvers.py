@@ -0,0 +1,33 @@
+import unittest
+from types import SimpleNamespace
+
+from new_graphene.fields.base import Field
+from new_graphene.fields.objecttypes import ObjectType
+from new_graphene.fields.resolvers import source_resolver
+from new_graphene.fields.scalars import String
+from new_graphene.schema import Schema
+
+
+class TestSourceResolver(unittest.TestCase):
+    def test_source_resolver(self):
+        resolver = source_resolver('full_name', 'Unknown')
+        self.assertEqual(resolver({'full_name': 'Kendall'}, None), 'Kendall')
+        self.assertEqual(resolver(SimpleNamespace(full_name='Kendall'), None), 'Kendall')
+        self.assertEqual(resolver({}, None), 'Unknown')
+
+    def test_fields_share_source_resolvers(self):
+        first = Field(String, source='full_name')
+        second = Field(String, source='full_name')
+        self.assertIs(first.resolver, second.resolver)
+
+        third = Field(String, source='full_name', default_value='Unknown')
+        self.assertIsNot(third.resolver, first.resolver)
+        self.assertEqual(third.resolver({}, None), 'Unknown')
+
+    def test_schema_execution(self):
+        class Query(ObjectType):
+            name = Field(String, source='full_name')
+
+        schema = Schema(query=Query)
+        result = schema.execute("""query { name }""", root_value={'full_name': 'Kendall'})
+        self.assertEqual(result.data, {'name': 'Kendall'})
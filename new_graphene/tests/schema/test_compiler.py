@@ -0,0 +1,143 @@
+import unittest
+
+from new_graphene.compiler import CompiledQuery
+from new_graphene.fields.arguments import Argument
+from new_graphene.fields.base import Field
+from new_graphene.fields.objecttypes import ObjectType
+from new_graphene.fields.scalars import ID, Integer, String
+from new_graphene.schema import Schema
+
+
+class User(ObjectType):
+    id = ID()
+    name = String()
+    age = Integer()
+
+
+class Query(ObjectType):
+    user = Field(User, search=String())
+
+    def resolve_user(root, info, search=None):
+        return {'id': 1, 'name': search or 'Kendall', 'age': 27}
+
+
+class TestCompiledQuery(unittest.TestCase):
+    def setUp(self):
+        self.schema = Schema(query=Query)
+
+    def assertSameResult(self, query: str, **kwargs):
+        compiled_query = self.schema.compile(query)
+        result = compiled_query(**kwargs)
+        expected = self.schema.execute(query, **kwargs)
+
+        self.assertEqual(result.data, expected.data)
+        self.assertEqual(result.errors, expected.errors)
+        return compiled_query
+
+    def test_compile(self):
+        query = """query { user { id name age __typename } }"""
+        compiled_query = self.assertSameResult(query)
+        self.assertIsInstance(compiled_query, CompiledQuery)
+        self.assertTrue(compiled_query.is_compiled)
+        self.assertIn('def compiled_query', compiled_query.source)
+        self.assertIs(self.schema.compile(query), compiled_query)
+
+    def test_compile_with_arguments(self):
+        compiled_query = self.assertSameResult(
+            """query { user(search: "Pauline") { name } }"""
+        )
+        self.assertTrue(compiled_query.is_compiled)
+
+    def test_compile_with_variables(self):
+        compiled_query = self.assertSameResult(
+            """query Search($search: String) { user(search: $search) { alias: name ...UserAge } }
+            fragment UserAge on User { age }""",
+            variables={'search': 'Pauline'}
+        )
+        self.assertTrue(compiled_query.is_compiled)
+
+    def test_literal_arguments_are_coerced_once(self):
+        compiled_query = self.assertSameResult(
+            """query Search($search: String) { user(search: "Pauline") { name } other: user(search: $search) { name } }""",
+            variables={'search': 'Kendall'}
+        )
+        self.assertTrue(compiled_query.is_compiled)
+        self.assertEqual(compiled_query.source.count('get_argument_values'), 1)
+
+    def test_argument_default_values(self):
+        class Query(ObjectType):
+            user = Field(User, search=Argument(String, default_value='Pauline'))
+
+            def resolve_user(root, info, search='Kendall'):
+                return {'id': 1, 'name': search, 'age': 27}
+
+        self.schema = Schema(query=Query)
+        compiled_query = self.assertSameResult("""query { user { name } }""")
+        self.assertTrue(compiled_query.is_compiled)
+        self.assertEqual(compiled_query().data, {'user': {'name': 'Pauline'}})
+
+    def test_fallback(self):
+        compiled_query = self.assertSameResult(
+            """query { user { name @skip(if: true) age } }"""
+        )
+        self.assertFalse(compiled_query.is_compiled)
+
+        compiled_query = self.assertSameResult(
+            """query { __schema { queryType { name } } }"""
+        )
+        self.assertFalse(compiled_query.is_compiled)
+
+    def test_invalid_query(self):
+        compiled_query = self.assertSameResult("""query { unknown }""")
+        self.assertFalse(compiled_query.is_compiled)
+
+    def test_resolver_error(self):
+        class Query(ObjectType):
+            name = String()
+
+            def resolve_name(root, info):
+                raise ValueError('Resolver error')
+
+        schema = Schema(query=Query)
+        compiled_query = schema.compile("""query { name }""")
+        self.assertTrue(compiled_query.is_compiled)
+
+        result = compiled_query()
+        self.assertEqual(result.data, {'name': None})
+        self.assertEqual(len(result.errors), 1)
+
+    def test_resolver_error_is_not_executed_twice(self):
+        calls = []
+
+        class Query(ObjectType):
+            first = String()
+            second = String()
+
+            def resolve_first(root, info):
+                calls.append('first')
+                return 'Kendall'
+
+            def resolve_second(root, info):
+                calls.append('second')
+                raise ValueError('Resolver error')
+
+        self.schema = Schema(query=Query)
+        compiled_query = self.schema.compile("""query { first second }""")
+        result = compiled_query()
+        self.assertTrue(compiled_query.is_compiled)
+        self.assertEqual(calls, ['first', 'second'])
+        self.assertEqual(result.data, {'first': 'Kendall', 'second': None})
+        self.assertEqual(result.errors[0].path, ['second'])
+
+        self.assertSameResult("""query { first second }""")
+
+    def test_async_resolver(self):
+        class Query(ObjectType):
+            name = String()
+
+            async def resolve_name(root, info):
+                return 'Kendall'
+
+        self.schema = Schema(query=Query)
+        compiled_query = self.schema.compile("""query { name }""")
+        self.assertFalse(compiled_query.is_compiled)
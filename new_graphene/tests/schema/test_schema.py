@@ -1,9 +1,11 @@
 import unittest
+import weakref
 
-from graphql import GraphQLObjectType
+from graphql import GraphQLObjectType, parse
 
 from new_graphene.fields.base import Field
 from new_graphene.fields.objecttypes import ObjectType
+from new_graphene.fields.resolvers import dict_resolver
 from new_graphene.fields.scalars import String
 from new_graphene.schema import Schema
 
@@ -39,6 +41,13 @@ class TestSchema(unittest.TestCase):
         if schema.graphql_schema.query_type is None:
             self.fail("Query type is None")
 
+    def test_graphql_schema_is_built_once(self):
+        schema = Schema(query=Query)
+        graphql_schema = schema.graphql_schema
+
+        schema.execute("""query { simple { name } }""")
+        self.assertIs(schema.graphql_schema, graphql_schema)
+
     def test_schema_with_custom_field_type(self):
         class UserDetails(ObjectType):
             firstname = String()
@@ -52,3 +61,104 @@ class TestSchema(unittest.TestCase):
         schema = Schema(query=User)
         result = schema.execute("""query { details { firstname } }""")
         print(result)
+
+    def test_document_cache(self):
+        schema = Schema(query=Query)
+
+        query = """query { simple { name } }"""
+        schema.execute(query)
+        schema.execute(query)
+
+        info = schema._cached_document.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.hits, 1)
+
+        schema.clear_document_cache()
+        self.assertEqual(schema._cached_document.cache_info().currsize, 0)
+
+    def test_document_cache_invalid_query(self):
+        schema = Schema(query=Query)
+
+        for _ in range(2):
+            result = schema.execute("""query { unknown }""")
+            self.assertIsNone(result.data)
+            self.assertTrue(result.errors)
+
+        self.assertEqual(schema._cached_document.cache_info().hits, 1)
+
+    def test_document_cache_errors_are_copied(self):
+        schema = Schema(query=Query)
+
+        result = schema.execute("""query { unknown }""")
+        result.errors.clear()
+
+        result = schema.execute("""query { unknown }""")
+        self.assertEqual(len(result.errors), 1)
+
+    def test_document_cache_does_not_reference_schema(self):
+        schema = Schema(query=Query)
+        schema.execute("""query { simple { name } }""")
+        schema.compile("""query { simple { name } }""")
+
+        reference = weakref.ref(schema)
+        del schema
+        self.assertIsNone(reference())
+
+    def test_document_cache_disabled(self):
+        schema = Schema(query=Query, document_cache_size=0)
+        schema.execute("""query { simple { name } }""")
+        schema.execute("""query { simple { name } }""")
+        self.assertEqual(schema._cached_document.cache_info().hits, 0)
+
+    def test_execute_document_node(self):
+        schema = Schema(query=Query)
+
+        document = parse("""query { simple { name } }""")
+        result = schema.execute(document)
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data, {'simple': None})
+        self.assertIn(document, schema._validated_documents)
+
+        result = schema.execute(parse("""query { unknown }"""))
+        self.assertIsNone(result.data)
+        self.assertTrue(result.errors)
+
+    def test_default_resolver_dict_and_object(self):
+        class Car:
+            name = 'Tesla'
+
+        class Query(ObjectType):
+            simple = Field(SimpleType)
+            other = Field(SimpleType)
+
+            def resolve_simple(root, info):
+                return {'name': 'Renault'}
+
+            def resolve_other(root, info):
+                return Car()
+
+        schema = Schema(query=Query)
+        result = schema.execute("""query { simple { name } other { name } }""")
+        self.assertIsNone(result.errors)
+        self.assertEqual(
+            result.data,
+            {'simple': {'name': 'Renault'}, 'other': {'name': 'Tesla'}}
+        )
+
+    def test_dict_default_resolver(self):
+        class User(ObjectType):
+            name = String()
+
+            class Meta:
+                default_resolver = dict_resolver
+
+        class Query(ObjectType):
+            user = Field(User)
+
+            def resolve_user(root, info):
+                return {'name': 'Pauline'}
+
+        schema = Schema(query=Query)
+        result = schema.execute("""query { user { name } }""")
+        self.assertIsNone(result.errors)
+        self.assertEqual(result.data, {'user': {'name': 'Pauline'}})
@@ -1,6 +1,7 @@
 import unittest
 
-from new_graphene.utils.module_loading import import_string, lazy_import
+from new_graphene.utils.module_loading import (cached_import_string,
+                                               import_string, lazy_import)
 
 
 class TestModuleLoading(unittest.TestCase):
@@ -26,3 +27,9 @@ class TestModuleLoading(unittest.TestCase):
         func = lazy_import('new_graphene.fields.base.Field')
         self.assertTrue(callable(func))
         self.assertIsNotNone(func())
+
+    def test_cached_import_string(self):
+        cached_import_string.cache_clear()
+        first = cached_import_string('new_graphene.fields.base.Field')
+        self.assertIs(cached_import_string('new_graphene.fields.base.Field'), first)
+        self.assertEqual(cached_import_string.cache_info().hits, 1)
@@ -1,3 +1,4 @@
+import functools
 from ast import List
 from functools import partial
 from importlib import import_module
@@ -45,6 +46,11 @@ def import_string(dotted_path: str, attributes: Sequence[str] = []):
     return loaded_attributes
 
 
+# Dotted paths used as forward references resolve to the same
+# attribute every time. Failed imports raise and are not cached
+cached_import_string = functools.lru_cache(maxsize=None)(import_string)
+
+
 def lazy_import(dotted_path: str, attributes: Sequence[str] = []):
     """Return a lazy reference to an imported module or attribute/class. 
     The import will be performed when the returned function is called.
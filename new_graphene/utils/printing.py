@@ -7,6 +7,8 @@ from new_graphene.typings import (TypeArgument, TypeBaseOptions, TypeBaseType,
 class PrintingMixin:
     """Utility class to print types in a readable format."""
 
+    __slots__ = ()
+
     @staticmethod
     def print_schema(schema: TypeSchema):
         return ''